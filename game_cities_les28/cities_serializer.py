@@ -1,14 +1,14 @@
 # cities_serializer.py
-from typing import List, Dict, Any
+from typing import Iterable, List, Dict, Any
 from city import City
 
 
 class CitiesSerializer:
-    def __init__(self, city_data: List[Dict[str, Any]]):
+    def __init__(self, city_data: Iterable[Dict[str, Any]]):
         """
         Преобразует данные из JSON в список объектов City.
         Обрабатывает вложенность coords и конвертирует строки в числа.
-        :param city_data: список словарей из JSON
+        :param city_data: список (или генератор) словарей из JSON
         """
         self._cities: List[City] = []
 
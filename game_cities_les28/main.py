@@ -1,13 +1,14 @@
 # main.py
+import json
 from json_reader import JSONReader
 from cities_serializer import CitiesSerializer
 
 
 def main():
-    # 1. Чтение данных из JSON
+    # 1–2. Потоковое чтение JSON и сериализация: записи идут в City по одной
     reader = JSONReader()
     try:
-        data = reader.read_file("cities.json")
+        serializer = CitiesSerializer(reader.iter_file("cities.json"))
     except FileNotFoundError:
         print("Ошибка: файл cities.json не найден.")
         return
@@ -15,8 +16,6 @@ def main():
         print(f"Ошибка: файл cities.json содержит некорректный JSON: {e}")
         return
 
-    # 2. Сериализация: JSON → City
-    serializer = CitiesSerializer(data)
     cities = serializer.get_all_cities()
 
     # 3. Вывод статистики и списка
@@ -0,0 +1,244 @@
+# benchmark.py
+"""
+Бенчмарк конвейера игры "Города":
+JSONReader → CitiesSerializer → CityGame (ходы игрока и компьютера).
+
+Для каждого размера генерируется синтетический справочник городов,
+замеряются время и пиковая память (tracemalloc) каждой стадии,
+результат выводится в JSON.
+
+Пример: python benchmark.py --sizes 10000,100000 --output bench.json
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Set, Tuple
+from json_reader import JSONReader
+from cities_serializer import CitiesSerializer
+from city_game import CityGame
+from city_index import CityIndex
+
+ALPHABET = "абвгдежзиклмнопрстуфхцчшэюя"
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+
+
+def generate_gazetteer(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Генерирует синтетический справочник в формате cities.json.
+    :param count: число городов
+    :param seed: зерно генератора (для воспроизводимости)
+    :return: список словарей
+    """
+    rng = random.Random(seed)
+    # Уникальность даёт код номера фиксированной ширины в середине названия,
+    # первая и последняя буквы случайны — как у настоящих городов
+    width = 1
+    while len(ALPHABET) ** width < count:
+        width += 1
+
+    records = []
+    for i in range(count):
+        code = []
+        number = i
+        for _ in range(width):
+            number, digit = divmod(number, len(ALPHABET))
+            code.append(ALPHABET[digit])
+        name = (rng.choice(ALPHABET) + "".join(code) + rng.choice(ALPHABET)).title()
+        records.append(
+            {
+                "coords": {
+                    "lat": f"{rng.uniform(41.0, 77.0):.5f}",
+                    "lon": f"{rng.uniform(19.0, 180.0):.5f}",
+                },
+                "district": f"Округ {rng.randrange(8)}",
+                "name": name,
+                "population": rng.randint(1_000, 12_000_000),
+                "subject": f"Субъект {rng.randrange(85)}",
+            }
+        )
+    return records
+
+
+def measure(func: Callable[[], Any]) -> Tuple[Any, Dict[str, float]]:
+    """
+    Выполняет func один раз, замеряя время и пиковую память.
+    :return: результат func и метрики
+    """
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, {"seconds": elapsed, "peak_bytes": peak}
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    if not samples:
+        return {"calls": 0}
+    ordered = sorted(samples)
+    return {
+        "calls": len(samples),
+        "mean_us": statistics.fmean(samples) * 1e6,
+        "p50_us": ordered[len(ordered) // 2] * 1e6,
+        "max_us": ordered[-1] * 1e6,
+    }
+
+
+def _play_turns(
+    serializer: CitiesSerializer,
+    index: CityIndex,
+    turns: int,
+    seed: int,
+    probe: Callable[[str, Callable[[], Any]], Any],
+) -> None:
+    """
+    Играет партии: игрок ходит первым ещё не названным городом на нужную букву
+    (как клиент нагрузочного теста game_server), каждый вызов human_turn,
+    computer_turn и check_game_over проходит через probe(имя, вызов).
+    При одинаковом seed последовательность ходов одна и та же.
+    """
+    rng = random.Random(seed)
+    game = CityGame(serializer, city_index=index, verbose=False)
+    named: Set[str] = set()
+    made = 0
+    while made < turns:
+        if game.last_letter is None:
+            city = rng.choice(index.cities)
+        else:
+            city = next(
+                (
+                    index.cities[row]
+                    for row in index.rows_starting_with(game.last_letter)
+                    if index.cities[row].name not in named
+                ),
+                None,
+            )
+        if city is None or not probe("human_turn", lambda: game.human_turn(city.name)):
+            game = CityGame(serializer, city_index=index, verbose=False)
+            named.clear()
+            continue
+        named.add(city.name)
+        made += 1
+
+        if not probe("check_game_over", game.check_game_over):
+            named.add(probe("computer_turn", game.computer_turn))
+            if not probe("check_game_over", game.check_game_over):
+                continue
+        game = CityGame(serializer, city_index=index, verbose=False)
+        named.clear()
+
+
+def benchmark_turns(
+    serializer: CitiesSerializer, turns: int, seed: int = 0
+) -> Dict[str, Dict[str, float]]:
+    """
+    Замеряет каждый вызов human_turn, computer_turn и check_game_over.
+    Партии играются дважды с одними и теми же ходами: сначала без tracemalloc
+    (он заметно замедляет вызовы) — задержки, затем под tracemalloc — память:
+    peak_bytes операции — наибольший прирост памяти внутри одного вызова,
+    "turn_phase" — пиковая память всего этапа ходов (включая партии).
+    :param serializer: источник городов
+    :param turns: сколько ходов игрока сделать суммарно
+    """
+    index = CityIndex(serializer.get_all_cities())
+    names = ("human_turn", "computer_turn", "check_game_over")
+    timings: Dict[str, List[float]] = {name: [] for name in names}
+    peaks: Dict[str, int] = {name: 0 for name in names}
+
+    def timed(name: str, func: Callable[[], Any]) -> Any:
+        started = time.perf_counter()
+        result = func()
+        timings[name].append(time.perf_counter() - started)
+        return result
+
+    _play_turns(serializer, index, turns, seed, timed)
+
+    phase_peak = 0
+
+    def traced(name: str, func: Callable[[], Any]) -> Any:
+        nonlocal phase_peak
+        current, peak = tracemalloc.get_traced_memory()
+        # reset_peak сбрасывает и пик всего этапа, поэтому он копится отдельно
+        phase_peak = max(phase_peak, peak)
+        tracemalloc.reset_peak()
+        result = func()
+        peak = tracemalloc.get_traced_memory()[1]
+        peaks[name] = max(peaks[name], peak - current)
+        phase_peak = max(phase_peak, peak)
+        return result
+
+    tracemalloc.start()
+    _play_turns(serializer, index, turns, seed, traced)
+    phase_peak = max(phase_peak, tracemalloc.get_traced_memory()[1])
+    tracemalloc.stop()
+
+    result: Dict[str, Dict[str, float]] = {}
+    for name in names:
+        result[name] = _summary(timings[name])
+        result[name]["peak_bytes"] = peaks[name]
+    result["turn_phase"] = {"peak_bytes": phase_peak}
+    return result
+
+
+def run(sizes, turns: int = 1000, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Прогоняет бенчмарк для каждого размера справочника.
+    :return: список результатов (по одному на размер)
+    """
+    results = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "cities.json")
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(generate_gazetteer(size, seed), file, ensure_ascii=False)
+
+            data, load = measure(lambda: JSONReader.read_file(path))
+            _, serialize = measure(lambda: CitiesSerializer(data))
+            del data
+            serializer, stream = measure(
+                lambda: CitiesSerializer(JSONReader.iter_file(path))
+            )
+
+        results.append(
+            {
+                "size": size,
+                "load": load,
+                "serialize": serialize,
+                "load_and_serialize_streaming": stream,
+                "turns": benchmark_turns(serializer, turns, seed),
+            }
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк игры 'Города'")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="размеры справочника через запятую",
+    )
+    parser.add_argument("--turns", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="файл для JSON (по умолчанию — stdout)")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    report = {"results": run(sizes, args.turns, args.seed)}
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
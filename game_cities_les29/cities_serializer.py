@@ -1,51 +1,142 @@
 # cities_serializer.py
-from typing import List, Dict, Any
-from city import City
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Dict, Any, Tuple
+from city import validate_city_fields
+from city_table import CityRow, CityTable
+
+
+def _parse_city(item: Dict[str, Any]) -> CityRow:
+    """
+    Проверяет одну запись из JSON и преобразует её в строку CityTable.
+    :param item: словарь с данными о городе
+    :return: кортеж (name, population, subject, district, latitude, longitude)
+    """
+    coords = item.get("coords", {})
+    lat_str = coords.get("lat")
+    lon_str = coords.get("lon")
+
+    if not lat_str or not lon_str:
+        raise ValueError("Отсутствуют координаты 'lat' или 'lon'")
+
+    try:
+        latitude = float(lat_str)
+        longitude = float(lon_str)
+    except (ValueError, TypeError):
+        raise ValueError(
+            f"Невозможно преобразовать координаты: lat={lat_str}, lon={lon_str}"
+        )
+
+    validate_city_fields(item["name"], item["population"])
+    return (
+        item["name"],
+        item["population"],
+        item["subject"],
+        item["district"],
+        latitude,
+        longitude,
+    )
+
+
+def _parse_chunk(
+    chunk: List[Tuple[int, Dict[str, Any]]]
+) -> Tuple[List[CityRow], List[Dict[str, Any]]]:
+    """
+    Проверяет кусок записей (выполняется в процессе-воркере).
+    :param chunk: пары (номер записи, словарь из JSON)
+    :return: строки валидных городов и отчёт об отклонённых записях
+    """
+    cities: List[CityRow] = []
+    errors: List[Dict[str, Any]] = []
+    for index, item in chunk:
+        try:
+            cities.append(_parse_city(item))
+        except (KeyError, ValueError, AttributeError) as e:
+            name = (
+                item.get("name", "неизвестно") if isinstance(item, dict) else "неизвестно"
+            )
+            errors.append({"index": index, "name": name, "error": str(e)})
+    return cities, errors
+
+
+def _chunked(
+    city_data: Iterable[Dict[str, Any]], chunk_size: int
+) -> Iterator[List[Tuple[int, Dict[str, Any]]]]:
+    numbered = enumerate(city_data)
+    while True:
+        chunk = list(islice(numbered, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _map_bounded(
+    pool: Executor, func, items: Iterable, window: int
+) -> Iterator:
+    """
+    Аналог pool.map, который держит в работе не более window задач.
+    Executor.map сразу отправляет все куски, и поток записей целиком
+    оказывается в памяти; здесь следующий кусок читается, только когда
+    забран результат самого старого. Результаты идут в исходном порядке.
+    """
+    pending = deque()
+    for item in items:
+        pending.append(pool.submit(func, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
 
 
 class CitiesSerializer:
-    def __init__(self, city_data: List[Dict[str, Any]]):  # ← исправлено: добавлено ":"
+    def __init__(
+        self,
+        city_data: Iterable[Dict[str, Any]],
+        workers: int = 1,
+        chunk_size: int = 5000,
+    ):
+        """
+        Преобразует данные из JSON в колоночную таблицу городов (CityTable).
+        Отклонённые записи не печатаются, а собираются в отчёт (get_errors).
+        :param city_data: список (или генератор) словарей из JSON
+        :param workers: число процессов для проверки (1 — без пула)
+        :param chunk_size: размер куска записей для одного воркера
+        """
+        self._table = CityTable()
+        self._errors: List[Dict[str, Any]] = []
+
+        chunks = _chunked(city_data, chunk_size)
+        if workers > 1:
+            # в работе не больше 2 кусков на воркер — память не растёт с размером файла
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for cities, errors in _map_bounded(
+                    pool, _parse_chunk, chunks, 2 * workers
+                ):
+                    self._table.extend_rows(cities)
+                    self._errors.extend(errors)
+        else:
+            for cities, errors in map(_parse_chunk, chunks):
+                self._table.extend_rows(cities)
+                self._errors.extend(errors)
+        self._table.compact()
+
+    @property
+    def table(self) -> CityTable:
+        """Таблица валидных городов."""
+        return self._table
+
+    def get_all_cities(self) -> CityTable:
         """
-        Преобразует данные из JSON в список объектов City.
-        :param city_data: список словарей из JSON
+        Возвращает валидные города: таблицу, которая создаёт CityView
+        при обращении (город определяется номером строки).
+        :return: CityTable
         """
-        self._cities: List[City] = []
-
-        for item in city_data:  # ← и здесь исправлено: было city_, стало city_data
-            try:
-                coords = item.get("coords", {})
-                lat_str = coords.get("lat")
-                lon_str = coords.get("lon")
-
-                if not lat_str or not lon_str:
-                    raise ValueError("Отсутствуют координаты 'lat' или 'lon'")
-
-                try:
-                    latitude = float(lat_str)
-                    longitude = float(lon_str)
-                except (ValueError, TypeError):
-                    raise ValueError(
-                        f"Невозможно преобразовать координаты: lat={lat_str}, lon={lon_str}"
-                    )
-
-                city = City(
-                    name=item["name"],
-                    population=item["population"],
-                    subject=item["subject"],
-                    district=item["district"],
-                    latitude=latitude,
-                    longitude=longitude,
-                )
-                self._cities.append(city)
-
-            except (KeyError, ValueError) as e:
-                print(
-                    f"[Ошибка] Пропущен город: {item.get('name', 'неизвестно')} — {e}"
-                )
-
-    def get_all_cities(self) -> List[City]:
+        return self._table
+
+    def get_errors(self) -> List[Dict[str, Any]]:
         """
-        Возвращает список валидных экземпляров City.
-        :return: список объектов City
+        Возвращает отчёт об отклонённых записях.
+        :return: список словарей {"index", "name", "error"} в исходном порядке
         """
-        return self._cities
+        return self._errors
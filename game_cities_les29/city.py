@@ -2,7 +2,19 @@
 from dataclasses import dataclass, field
 
 
-@dataclass(order=True)
+def validate_city_fields(name, population) -> None:
+    """
+    Общая проверка полей города (используется City и CityTable).
+    :param name: название города
+    :param population: население
+    """
+    if not isinstance(name, str) or not name.strip():
+        raise ValueError("Поле 'name' должно быть непустой строкой.")
+    if not isinstance(population, int) or population <= 0:
+        raise ValueError("Поле 'population' должно быть положительным целым числом.")
+
+
+@dataclass(order=True, slots=True)
 class City:
     name: str = field(compare=False)
     population: int = field(compare=True)
@@ -16,9 +28,4 @@ class City:
         """
         Валидация данных после инициализации.
         """
-        if not isinstance(self.name, str) or not self.name.strip():
-            raise ValueError("Поле 'name' должно быть непустой строкой.")
-        if not isinstance(self.population, int) or self.population <= 0:
-            raise ValueError(
-                "Поле 'population' должно быть положительным целым числом."
-            )
+        validate_city_fields(self.name, self.population)
@@ -1,18 +1,51 @@
 # city_game.py
-from typing import Optional, List
+from typing import Optional, List, Dict, Sequence, Set
 from city import City
+from city_index import CityIndex
+from city_solver import CitySolver
 
 
 class CityGame:
-    def __init__(self, cities_serializer):
+    def __init__(
+        self,
+        cities_serializer,
+        geo_mode: bool = False,
+        solver_mode: bool = False,
+        city_index: Optional[CityIndex] = None,
+        verbose: bool = True,
+    ):
         """
         Инициализация игры.
         :param cities_serializer: сериализатор, возвращающий список городов
+        :param geo_mode: компьютер отвечает ближайшим к предыдущему городом
+        :param solver_mode: компьютер выбирает ход решателем (CitySolver)
+        :param city_index: общий индекс городов (если не задан — строится заново)
+        :param verbose: печатать ли ошибки ходов (текст всегда есть в last_error)
         """
         self.cities_serializer = cities_serializer
-        self.cities: List[City] = self.cities_serializer.get_all_cities()
-        self.used_cities: List[City] = []
+        if city_index is None:
+            city_index = CityIndex(self.cities_serializer.get_all_cities())
+        self.city_index = city_index
+        self.cities: Sequence[City] = city_index.cities
+        # номера строк названных городов по порядку ходов
+        self.used_rows: List[int] = []
         self.last_letter: Optional[str] = None  # буква для следующего хода
+        self.last_error: str = ""
+        self.verbose = verbose
+
+        # те же номера строк — проверка "уже назван" за O(1)
+        self._used: Set[int] = set()
+        # буква → позиция первого, возможно, свободного города в city_index
+        self._cursors: Dict[str, int] = {}
+        self._geo_mode = geo_mode
+        self._solver: Optional[CitySolver] = (
+            CitySolver(self.cities, self._get_last_letter) if solver_mode else None
+        )
+
+    @property
+    def used_cities(self) -> List[City]:
+        """Названные города по порядку ходов (создаются при обращении)."""
+        return [self.cities[row] for row in self.used_rows]
 
     def human_turn(self, city_input: str) -> bool:
         """
@@ -20,29 +53,27 @@ class CityGame:
         :param city_input: название города
         :return: True, если ход корректный
         """
-        city_name = city_input.strip().title()
+        city_name = city_input.strip()
         if not city_name:
-            print("Ошибка: введите название города.")
-            return False
+            return self._reject("Ошибка: введите название города.")
 
-        city_obj = next((c for c in self.cities if c.name == city_name), None)
-        if not city_obj:
-            print(f"Ошибка: город '{city_name}' не найден.")
-            return False
+        row = self.city_index.find_row(city_name)
+        if row is None:
+            return self._reject(f"Ошибка: город '{city_name}' не найден.")
 
-        if city_obj in self.used_cities:
-            print(f"Ошибка: город '{city_name}' уже использован.")
-            return False
+        if row in self._used:
+            return self._reject(f"Ошибка: город '{city_name}' уже использован.")
 
+        city_name = self.cities[row].name
         if self.last_letter:
             first_letter = self._get_first_letter(city_name)
             if first_letter.lower() != self.last_letter.lower():
-                print(
+                return self._reject(
                     f"Ошибка: город должен начинаться с буквы '{self.last_letter.upper()}'."
                 )
-                return False
 
-        self.used_cities.append(city_obj)
+        self.last_error = ""
+        self._mark_used(row)
         self.last_letter = self._get_last_letter(city_name)
         return True
 
@@ -54,18 +85,17 @@ class CityGame:
         if not self.last_letter:
             return ""
 
-        available = [
-            c
-            for c in self.cities
-            if c not in self.used_cities
-            and self._get_first_letter(c.name).lower() == self.last_letter.lower()
-        ]
-
-        if available:
-            chosen = available[0]
-            self.used_cities.append(chosen)
-            self.last_letter = self._get_last_letter(chosen.name)
-            return chosen.name
+        if self._solver is not None:
+            chosen = self._solver.choose(self.last_letter)
+        else:
+            chosen = self._nearest_available()
+            if chosen is None:
+                chosen = self._peek_available(self.last_letter)
+        if chosen is not None:
+            self._mark_used(chosen)
+            name = self.cities[chosen].name
+            self.last_letter = self._get_last_letter(name)
+            return name
 
         return ""
 
@@ -76,11 +106,62 @@ class CityGame:
         """
         if not self.last_letter:
             return False
-        return not any(
-            c not in self.used_cities
-            and self._get_first_letter(c.name).lower() == self.last_letter.lower()
-            for c in self.cities
+        return self._peek_available(self.last_letter) is None
+
+    def _reject(self, message: str) -> bool:
+        """
+        Запоминает (и при verbose печатает) причину отказа в ходе.
+        :param message: текст ошибки
+        :return: всегда False
+        """
+        self.last_error = message
+        if self.verbose:
+            print(message)
+        return False
+
+    def _peek_available(self, letter: str) -> Optional[int]:
+        """
+        Возвращает первый неиспользованный город на букву (не помечая его).
+        Курсор по букве только сдвигается вперёд мимо использованных городов,
+        поэтому каждый город пропускается не более одного раза — O(1) амортизированно.
+        :param letter: первая буква
+        :return: номер строки города в cities или None
+        """
+        letter = letter.lower()
+        pool = self.city_index.rows_starting_with(letter)
+        position = self._cursors.get(letter, 0)
+        while position < len(pool) and pool[position] in self._used:
+            position += 1
+        self._cursors[letter] = position
+        return pool[position] if position < len(pool) else None
+
+    def _nearest_available(self) -> Optional[int]:
+        """
+        В гео-режиме ищет ближайший к предыдущему неиспользованный город на нужную букву.
+        :return: номер строки города или None
+        """
+        if not self._geo_mode or not self.used_rows:
+            return None
+        previous = self.cities[self.used_rows[-1]]
+        letter = self.last_letter.lower()
+        found = self.city_index.spatial_index.nearest_rows(
+            previous.latitude,
+            previous.longitude,
+            k=1,
+            predicate=lambda row: row not in self._used
+            and self._get_first_letter(self.cities[row].name).lower() == letter,
         )
+        return found[0][0] if found else None
+
+    def _mark_used(self, row: int) -> None:
+        """
+        Помечает город использованным.
+        :param row: номер строки названного города
+        """
+        self.used_rows.append(row)
+        self._used.add(row)
+        if self._solver is not None:
+            self._solver.remove(row)
 
     @staticmethod
     def _get_first_letter(name: str) -> str:
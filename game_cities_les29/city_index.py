@@ -0,0 +1,101 @@
+# city_index.py
+import re
+from array import array
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
+from city import City
+from city_table import CityTable
+from city_spatial_index import CitySpatialIndex
+
+# Пробелы вокруг дефиса ("Ростов - на - Дону") и повторные пробелы
+_HYPHEN_RE = re.compile(r"\s*-\s*")
+_SPACES_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def normalize_name(name: str) -> str:
+    """
+    Приводит название к виду для сравнения: без учёта регистра,
+    'ё' → 'е', без лишних пробелов (в том числе вокруг дефисов).
+    :param name: название города
+    :return: нормализованное название
+    """
+    name = name.strip().lower().replace("ё", "е")
+    name = _HYPHEN_RE.sub("-", name)
+    return _SPACES_RE.sub(" ", name)
+
+
+class CityIndex:
+    """
+    Неизменяемый индекс городов, общий для всех партий.
+    Партия (CityGame) хранит только свои использованные города
+    и позиции в списках по буквам, поэтому один индекс
+    можно разделять между тысячами одновременных сессий.
+    Город определяется номером строки — позицией в cities
+    (для CityTable — номером строки таблицы); индекс хранит только
+    номера строк, а объекты городов создаются при обращении.
+    """
+
+    def __init__(self, cities: Sequence[City]):
+        """
+        :param cities: города (например, CitiesSerializer.get_all_cities())
+        """
+        # CityTable не копируем: его CityView создаются при обращении
+        self.cities: Sequence[City] = (
+            cities if isinstance(cities, CityTable) else tuple(cities)
+        )
+
+        by_name: Dict[str, int] = {}
+        by_letter: Dict[str, array] = {}
+        for row, city in enumerate(self.cities):
+            name = city.name
+            # при совпадении названий остаётся первый город по списку
+            by_name.setdefault(normalize_name(name), row)
+            letter = name[0].lower()
+            if letter not in by_letter:
+                by_letter[letter] = array("I")
+            by_letter[letter].append(row)
+
+        self._by_name = by_name
+        self._by_letter = by_letter
+        self._spatial_index: Optional[CitySpatialIndex] = None
+
+    def find_row(self, name: str) -> Optional[int]:
+        """
+        Ищет номер строки города по названию за O(1).
+        :param name: название в любом регистре
+        :return: номер строки или None
+        """
+        return self._by_name.get(normalize_name(name))
+
+    def find(self, name: str) -> Optional[City]:
+        """
+        Ищет город по названию за O(1).
+        :param name: название в любом регистре
+        :return: город или None
+        """
+        row = self.find_row(name)
+        return None if row is None else self.cities[row]
+
+    def rows_starting_with(self, letter: str) -> Sequence[int]:
+        """
+        Номера строк городов на букву в исходном порядке.
+        :param letter: первая буква
+        :return: массив номеров строк (не изменять)
+        """
+        return self._by_letter.get(letter.lower(), ())
+
+    def starting_with(self, letter: str) -> List[City]:
+        """
+        Города на букву в исходном порядке (создаются при каждом вызове).
+        :param letter: первая буква
+        :return: список городов
+        """
+        return [self.cities[row] for row in self.rows_starting_with(letter)]
+
+    @property
+    def spatial_index(self) -> CitySpatialIndex:
+        """Пространственный индекс (строится при первом обращении)."""
+        if self._spatial_index is None:
+            self._spatial_index = CitySpatialIndex(self.cities)
+        return self._spatial_index
@@ -0,0 +1,181 @@
+# city_snapshot.py
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, List, Optional, Sequence
+from city_table import CityTable, CityView, StringTable
+
+# Заголовок: сигнатура, версия формата, число городов, число строк
+_HEADER = struct.Struct("<4sIII")
+_MAGIC = b"CTY1"
+_VERSION = 1
+
+
+class CitySnapshot:
+    """
+    Бинарный снимок проверенных городов.
+    Числовые поля хранятся колонками фиксированной ширины,
+    строки (name, subject, district) — в общей таблице строк.
+
+    Формат файла:
+    - заголовок (_HEADER)
+    - population: int64 × N, latitude: float64 × N, longitude: float64 × N
+    - индексы name, subject, district в таблице строк: uint32 × N каждая
+    - смещения строк: uint32 × (S + 1), затем байты строк в UTF-8
+    """
+
+    def __init__(self, table: CityTable, mapping: Optional[mmap.mmap] = None):
+        """
+        :param table: таблица городов (столбцы могут ссылаться на mapping)
+        :param mapping: отображение файла снимка, которое держит таблица
+        """
+        self.table = table
+        self._mapping = mapping
+
+    def get_all_cities(self) -> CityTable:
+        """
+        Возвращает города (тот же интерфейс, что у CitiesSerializer).
+        :return: таблица городов (CityView создаются при обращении)
+        """
+        return self.table
+
+    @staticmethod
+    def compile(cities: Sequence[CityView], snapshot_path: str) -> None:
+        """
+        Записывает города в бинарный снимок.
+        Файл сначала пишется во временный, затем атомарно подменяется.
+        :param cities: список проверенных городов
+        :param snapshot_path: путь к файлу снимка
+        """
+        strings: List[str] = []
+        string_ids: Dict[str, int] = {}
+
+        def intern(value: str) -> int:
+            if value not in string_ids:
+                string_ids[value] = len(strings)
+                strings.append(value)
+            return string_ids[value]
+
+        names = [intern(c.name) for c in cities]
+        subjects = [intern(c.subject) for c in cities]
+        districts = [intern(c.district) for c in cities]
+
+        encoded = [s.encode("utf-8") for s in strings]
+        offsets = [0]
+        for item in encoded:
+            offsets.append(offsets[-1] + len(item))
+
+        count = len(cities)
+        tmp_path = snapshot_path + ".tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, _VERSION, count, len(strings)))
+            file.write(struct.pack(f"<{count}q", *(c.population for c in cities)))
+            file.write(struct.pack(f"<{count}d", *(c.latitude for c in cities)))
+            file.write(struct.pack(f"<{count}d", *(c.longitude for c in cities)))
+            file.write(struct.pack(f"<{count}I", *names))
+            file.write(struct.pack(f"<{count}I", *subjects))
+            file.write(struct.pack(f"<{count}I", *districts))
+            file.write(struct.pack(f"<{len(offsets)}I", *offsets))
+            file.write(b"".join(encoded))
+        os.replace(tmp_path, snapshot_path)
+
+    @classmethod
+    def load(cls, snapshot_path: str) -> "CitySnapshot":
+        """
+        Отображает снимок в память (mmap) и отдаёт города прямо из отображения:
+        столбцы не копируются, объекты City не создаются и повторно не проверяются,
+        строки декодируются при обращении.
+        Вызывает ValueError, если файл повреждён или другой версии.
+        :param snapshot_path: путь к файлу снимка
+        :return: CitySnapshot (держит файл открытым до close())
+        """
+        with open(snapshot_path, "rb") as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            table = cls._map_table(mapping, snapshot_path)
+        except (ValueError, struct.error):
+            mapping.close()
+            raise
+        return cls(table, mapping)
+
+    @staticmethod
+    def _map_table(mapping: mmap.mmap, snapshot_path: str) -> CityTable:
+        # Все размеры проверяются до создания memoryview: пока есть ссылки
+        # на буфер, mmap нельзя закрыть
+        if len(mapping) < _HEADER.size:
+            raise ValueError(f"Снимок повреждён: {snapshot_path}")
+        magic, version, count, string_count = _HEADER.unpack_from(mapping, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"Неподдерживаемый формат снимка: {snapshot_path}")
+
+        blob_start = _HEADER.size + (3 * 8 + 3 * 4) * count + 4 * (string_count + 1)
+        if len(mapping) < blob_start:
+            raise ValueError(f"Снимок повреждён: {snapshot_path}")
+        (blob_size,) = struct.unpack_from("<I", mapping, blob_start - 4)
+        if len(mapping) < blob_start + blob_size:
+            raise ValueError(f"Снимок повреждён: {snapshot_path}")
+
+        view = memoryview(mapping)
+        pos = _HEADER.size
+
+        def column(code: str, length: int) -> Sequence:
+            nonlocal pos
+            raw = view[pos : pos + array(code).itemsize * length]
+            pos += len(raw)
+            if sys.byteorder == "little":
+                return raw.cast(code)
+            # на big-endian столбцы приходится копировать с перестановкой байт
+            values = array(code, raw)
+            values.byteswap()
+            return values
+
+        populations = column("q", count)
+        latitudes = column("d", count)
+        longitudes = column("d", count)
+        names = column("I", count)
+        subjects = column("I", count)
+        districts = column("I", count)
+        offsets = column("I", string_count + 1)
+        strings = StringTable(view[blob_start : blob_start + blob_size], offsets)
+
+        return CityTable.from_columns(
+            populations, latitudes, longitudes, names, subjects, districts, strings
+        )
+
+    def close(self) -> None:
+        """
+        Закрывает отображение файла.
+        Перед этим нужно отпустить все города снимка (CityIndex, партии),
+        иначе mmap сообщит об используемом буфере (BufferError).
+        """
+        if self._mapping is not None:
+            self.table = CityTable()
+            self._mapping.close()
+            self._mapping = None
+
+    @staticmethod
+    def is_fresh(snapshot_path: str, source_path: str) -> bool:
+        """
+        Проверяет, что снимок существует и новее исходного JSON.
+        :param snapshot_path: путь к файлу снимка
+        :param source_path: путь к cities.json
+        :return: True, если снимок можно использовать
+        """
+        if not os.path.exists(snapshot_path):
+            return False
+        return os.path.getmtime(snapshot_path) >= os.path.getmtime(source_path)
+
+
+if __name__ == "__main__":
+    from json_reader import JSONReader
+    from cities_serializer import CitiesSerializer
+
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    source = os.path.join(base_dir, "cities.json")
+    target = os.path.join(base_dir, "cities.bin")
+
+    serializer = CitiesSerializer(JSONReader.iter_file(source))
+    CitySnapshot.compile(serializer.get_all_cities(), target)
+    print(f"Снимок записан: {target} ({len(serializer.get_all_cities())} городов)")
@@ -0,0 +1,208 @@
+# city_solver.py
+import random
+import time
+from array import array
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+from city import City
+
+WIN = 1_000_000
+_MAX_DEPTH = 64
+_MAX_TABLE_SIZE = 200_000
+
+# Флаги записей таблицы транспозиций
+_EXACT, _LOWER, _UPPER = 0, 1, 2
+
+
+class _Timeout(Exception):
+    """Бюджет времени на ход исчерпан."""
+
+
+class CitySolver:
+    """
+    Решатель для игры "Города" на графе переходов букв.
+    Вершины — буквы, ребро first → last хранит число неиспользованных
+    городов с такой первой и последней буквой. Все города одного ребра
+    равнозначны, поэтому перебираются рёбра, а не отдельные города.
+
+    Ход ищется негамаксом с альфа-бета отсечением и итеративным углублением
+    в пределах бюджета времени; оценки состояний запоминаются
+    в таблице транспозиций.
+    Города обозначаются номерами в исходной последовательности cities.
+    """
+
+    def __init__(
+        self,
+        cities: Sequence[City],
+        last_letter: Callable[[str], str],
+        budget_ms: float = 5.0,
+    ):
+        """
+        :param cities: последовательность городов (например, CityTable)
+        :param last_letter: правило последней буквы (с учётом 'ь'/'ъ')
+        :param budget_ms: бюджет времени на один ход в миллисекундах
+        """
+        self._cities = cities
+        self._last_letter = last_letter
+        self.budget = budget_ms / 1000
+
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._out: Dict[str, int] = {}  # буква → число неиспользованных городов на неё
+        self._stacks: Dict[Tuple[str, str], array] = {}  # ребро → номера городов
+        self._removed: Set[int] = set()
+
+        # Аддитивный хеш состояния: сумма ключ_ребра × число_городов (mod 2^64)
+        rng = random.Random(0)
+        self._keys: Dict[Tuple[str, str], int] = {}
+        self._hash = 0
+        self._table: Dict[Tuple[int, str], Tuple[int, int, int]] = {}
+
+        for row in range(len(cities) - 1, -1, -1):
+            edge = self._edge(cities[row].name)
+            first, last = edge
+            if edge not in self._stacks:
+                self._stacks[edge] = array("I")
+            self._stacks[edge].append(row)
+            edges = self._counts.setdefault(first, {})
+            edges[last] = edges.get(last, 0) + 1
+            self._out[first] = self._out.get(first, 0) + 1
+            if edge not in self._keys:
+                self._keys[edge] = rng.getrandbits(64)
+            self._hash = (self._hash + self._keys[edge]) & 0xFFFFFFFFFFFFFFFF
+
+    def _edge(self, name: str) -> Tuple[str, str]:
+        return name[0].lower(), self._last_letter(name)
+
+    def remove(self, row: int) -> None:
+        """
+        Убирает названный город из графа.
+        :param row: номер использованного города
+        """
+        if row in self._removed:
+            return
+        self._removed.add(row)
+        self._apply(self._edge(self._cities[row].name))
+
+    def choose(self, letter: str) -> Optional[int]:
+        """
+        Выбирает город для ответа на букву (не помечая его использованным).
+        :param letter: буква, на которую нужно ответить
+        :return: номер города или None, если ответить нечем
+        """
+        letter = letter.lower()
+        if not self._out.get(letter):
+            return None
+
+        last = self._search(letter)
+        stack = self._stacks[(letter, last)]
+        while stack[-1] in self._removed:
+            stack.pop()
+        return stack[-1]
+
+    def _apply(self, edge: Tuple[str, str]) -> None:
+        first, last = edge
+        self._counts[first][last] -= 1
+        self._out[first] -= 1
+        self._hash = (self._hash - self._keys[edge]) & 0xFFFFFFFFFFFFFFFF
+
+    def _undo(self, edge: Tuple[str, str]) -> None:
+        first, last = edge
+        self._counts[first][last] += 1
+        self._out[first] += 1
+        self._hash = (self._hash + self._keys[edge]) & 0xFFFFFFFFFFFFFFFF
+
+    def _moves(self, letter: str) -> List[str]:
+        """Доступные последние буквы; сначала те, что сильнее "душат" соперника."""
+        edges = self._counts.get(letter, {})
+        moves = [last for last, count in edges.items() if count > 0]
+        moves.sort(key=lambda last: self._out.get(last, 0))
+        return moves
+
+    def _evaluate(self, letter: str) -> int:
+        """Оценка для ходящего игрока: сколько у него вариантов ответа."""
+        return self._out.get(letter, 0)
+
+    def _search(self, letter: str) -> str:
+        """
+        Итеративное углубление: возвращает лучший ход последней
+        полностью просчитанной глубины.
+        """
+        deadline = time.perf_counter() + self.budget
+        if len(self._table) > _MAX_TABLE_SIZE:
+            self._table.clear()
+
+        moves = self._moves(letter)
+        best = moves[0]
+        try:
+            for depth in range(1, _MAX_DEPTH + 1):
+                value, best = self._search_root(letter, moves, best, depth, deadline)
+                if abs(value) >= WIN - _MAX_DEPTH:
+                    break  # исход партии уже известен
+        except _Timeout:
+            pass
+        return best
+
+    def _search_root(
+        self, letter: str, moves: List[str], previous_best: str, depth: int, deadline: float
+    ) -> Tuple[int, str]:
+        ordered = [previous_best] + [m for m in moves if m != previous_best]
+        alpha, beta = -WIN - 1, WIN + 1
+        best_value, best_move = -WIN - 1, previous_best
+        for last in ordered:
+            edge = (letter, last)
+            self._apply(edge)
+            try:
+                value = -self._negamax(last, depth - 1, -beta, -alpha, 1, deadline)
+            finally:
+                self._undo(edge)
+            if value > best_value:
+                best_value, best_move = value, last
+            alpha = max(alpha, value)
+        return best_value, best_move
+
+    def _negamax(
+        self, letter: str, depth: int, alpha: int, beta: int, ply: int, deadline: float
+    ) -> int:
+        if time.perf_counter() > deadline:
+            raise _Timeout
+
+        moves = self._moves(letter)
+        if not moves:
+            return -WIN + ply  # ходящему нечем ответить
+        if depth == 0:
+            return self._evaluate(letter)
+
+        key = (self._hash, letter)
+        entry = self._table.get(key)
+        if entry is not None and entry[0] >= depth:
+            _, value, flag = entry
+            if flag == _EXACT:
+                return value
+            if flag == _LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value
+
+        alpha_orig = alpha
+        best = -WIN - 1
+        for last in moves:
+            edge = (letter, last)
+            self._apply(edge)
+            try:
+                value = -self._negamax(last, depth - 1, -beta, -alpha, ply + 1, deadline)
+            finally:
+                self._undo(edge)
+            best = max(best, value)
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+
+        if best <= alpha_orig:
+            flag = _UPPER
+        elif best >= beta:
+            flag = _LOWER
+        else:
+            flag = _EXACT
+        self._table[key] = (depth, best, flag)
+        return best
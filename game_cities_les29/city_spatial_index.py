@@ -0,0 +1,221 @@
+# city_spatial_index.py
+import heapq
+import math
+from typing import Callable, List, Optional, Sequence, Tuple
+from city import City
+
+try:
+    import numpy as np
+except ImportError:  # NumPy не обязателен: без него работает чистый Python
+    np = None
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Расстояние по большому кругу между двумя точками.
+    :return: расстояние в километрах
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _to_xyz(lat: float, lon: float) -> Tuple[float, float, float]:
+    """Точка на единичной сфере: длина хорды монотонна по расстоянию на сфере."""
+    phi, lam = math.radians(lat), math.radians(lon)
+    cos_phi = math.cos(phi)
+    return cos_phi * math.cos(lam), cos_phi * math.sin(lam), math.sin(phi)
+
+
+def _chord2(a: Tuple[float, float, float], b: Tuple[float, float, float]) -> float:
+    dx, dy, dz = a[0] - b[0], a[1] - b[1], a[2] - b[2]
+    return dx * dx + dy * dy + dz * dz
+
+
+class CitySpatialIndex:
+    """
+    k-d дерево по координатам городов.
+    Города переводятся в точки на единичной сфере, поэтому поиск
+    не ломается на 180-м меридиане и у полюсов; наружу отдаются
+    расстояния по формуле гаверсинуса.
+    """
+
+    def __init__(self, cities: Sequence[City]):
+        """
+        :param cities: города (например, CitiesSerializer.get_all_cities())
+        """
+        # Последовательность не копируется: города CityTable создаются при обращении
+        self._cities = cities
+        self._points = [_to_xyz(c.latitude, c.longitude) for c in self._cities]
+        # Узлы дерева в параллельных списках: индекс города, ось, потомки
+        self._node_city: List[int] = []
+        self._node_axis: List[int] = []
+        self._node_left: List[int] = []
+        self._node_right: List[int] = []
+        self._root = self._build(list(range(len(self._cities))), 0)
+
+    def _build(self, indices: List[int], depth: int) -> int:
+        if not indices:
+            return -1
+        axis = depth % 3
+        indices.sort(key=lambda i: self._points[i][axis])
+        middle = len(indices) // 2
+
+        node = len(self._node_city)
+        self._node_city.append(indices[middle])
+        self._node_axis.append(axis)
+        self._node_left.append(-1)
+        self._node_right.append(-1)
+
+        self._node_left[node] = self._build(indices[:middle], depth + 1)
+        self._node_right[node] = self._build(indices[middle + 1 :], depth + 1)
+        return node
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = 1,
+        predicate: Optional[Callable[[City], bool]] = None,
+    ) -> List[Tuple[City, float]]:
+        """
+        Ищет k ближайших городов к точке.
+        :param latitude: широта точки
+        :param longitude: долгота точки
+        :param k: сколько городов вернуть
+        :param predicate: необязательный фильтр городов
+        :return: список (город, расстояние в км), от ближнего к дальнему
+        """
+        row_predicate = None
+        if predicate is not None:
+
+            def row_predicate(index: int) -> bool:
+                return predicate(self._cities[index])
+
+        found = self.nearest_rows(latitude, longitude, k, row_predicate)
+        return [(self._cities[index], distance) for index, distance in found]
+
+    def nearest_rows(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = 1,
+        predicate: Optional[Callable[[int], bool]] = None,
+    ) -> List[Tuple[int, float]]:
+        """
+        То же, что nearest, но по номерам городов в исходной последовательности.
+        :param predicate: необязательный фильтр по номеру города
+        :return: список (номер города, расстояние в км), от ближнего к дальнему
+        """
+        if k <= 0:
+            return []
+        query = _to_xyz(latitude, longitude)
+        heap: List[Tuple[float, int]] = []  # (-хорда², индекс города)
+
+        def visit(node: int) -> None:
+            if node < 0:
+                return
+            index = self._node_city[node]
+            point = self._points[index]
+            if predicate is None or predicate(index):
+                dist2 = _chord2(query, point)
+                if len(heap) < k:
+                    heapq.heappush(heap, (-dist2, index))
+                elif dist2 < -heap[0][0]:
+                    heapq.heapreplace(heap, (-dist2, index))
+
+            axis = self._node_axis[node]
+            diff = query[axis] - point[axis]
+            near, far = (
+                (self._node_left[node], self._node_right[node])
+                if diff < 0
+                else (self._node_right[node], self._node_left[node])
+            )
+            visit(near)
+            if len(heap) < k or diff * diff < -heap[0][0]:
+                visit(far)
+
+        visit(self._root)
+        return [
+            (index, self._distance(latitude, longitude, index))
+            for _, index in sorted(heap, reverse=True)
+        ]
+
+    def within_radius(
+        self, latitude: float, longitude: float, radius_km: float
+    ) -> List[Tuple[City, float]]:
+        """
+        Ищет все города в радиусе от точки.
+        :param latitude: широта точки
+        :param longitude: долгота точки
+        :param radius_km: радиус в километрах
+        :return: список (город, расстояние в км), от ближнего к дальнему
+        """
+        if radius_km < 0:
+            return []
+        query = _to_xyz(latitude, longitude)
+        angle = min(math.pi, radius_km / EARTH_RADIUS_KM)
+        limit2 = (2 * math.sin(angle / 2)) ** 2 + 1e-12
+        found: List[int] = []
+
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node < 0:
+                continue
+            index = self._node_city[node]
+            point = self._points[index]
+            if _chord2(query, point) <= limit2:
+                found.append(index)
+            axis = self._node_axis[node]
+            diff = query[axis] - point[axis]
+            if diff < 0 or diff * diff <= limit2:
+                stack.append(self._node_left[node])
+            if diff >= 0 or diff * diff <= limit2:
+                stack.append(self._node_right[node])
+
+        result = [
+            (index, self._distance(latitude, longitude, index)) for index in found
+        ]
+        result.sort(key=lambda pair: pair[1])
+        return [
+            (self._cities[index], distance)
+            for index, distance in result
+            if distance <= radius_km
+        ]
+
+    def _distance(self, latitude: float, longitude: float, index: int) -> float:
+        city = self._cities[index]
+        return haversine(latitude, longitude, city.latitude, city.longitude)
+
+    @staticmethod
+    def distance_matrix(origins: Sequence[City], targets: Sequence[City]):
+        """
+        Матрица расстояний (км) между двумя наборами городов.
+        С NumPy считается векторно и возвращается ndarray,
+        без NumPy — список списков.
+        :param origins: города-строки матрицы
+        :param targets: города-столбцы матрицы
+        """
+        if np is None:
+            return [
+                [haversine(a.latitude, a.longitude, b.latitude, b.longitude) for b in targets]
+                for a in origins
+            ]
+
+        lat1 = np.radians([c.latitude for c in origins])[:, None]
+        lon1 = np.radians([c.longitude for c in origins])[:, None]
+        lat2 = np.radians([c.latitude for c in targets])[None, :]
+        lon2 = np.radians([c.longitude for c in targets])[None, :]
+        a = (
+            np.sin((lat2 - lat1) / 2) ** 2
+            + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+        )
+        return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
@@ -0,0 +1,278 @@
+# city_table.py
+from array import array
+from functools import total_ordering
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Tuple
+from city import City, validate_city_fields
+
+# Строка таблицы в порядке аргументов CityTable.append
+CityRow = Tuple[str, int, str, str, float, float]
+
+
+class StringTable(Sequence[str]):
+    """
+    Таблица строк в одном буфере UTF-8 со смещениями (тот же формат,
+    что в снимке CitySnapshot). Строки не хранятся объектами str:
+    каждая декодируется при обращении и не кэшируется.
+    Буфер может быть memoryview над mmap — тогда таблица только для чтения.
+    """
+
+    def __init__(self, blob=None, offsets: Optional[Sequence[int]] = None):
+        """
+        :param blob: байты строк подряд (по умолчанию — пустой bytearray)
+        :param offsets: смещения начала строк и конца последней (S + 1 значение)
+        """
+        self._blob = bytearray() if blob is None else blob
+        self._offsets = array("I", [0]) if offsets is None else offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        return str(self._blob[self._offsets[index] : self._offsets[index + 1]], "utf-8")
+
+    def append(self, value: str) -> int:
+        """
+        Добавляет строку в конец таблицы.
+        :return: индекс добавленной строки
+        """
+        self._blob += value.encode("utf-8")
+        self._offsets.append(len(self._blob))
+        return len(self._offsets) - 2
+
+
+class CityTable:
+    """
+    Колоночное хранилище городов.
+    Население и координаты лежат в параллельных массивах array,
+    строки (name, subject, district) — в общей таблице строк StringTable
+    (один буфер UTF-8), флаг is_used — в bytearray.
+    Город определяется номером строки таблицы; представления CityView
+    создаются только при обращении (table[i], итерация) и не хранятся.
+    Столбцы могут лежать и в отображённом в память файле (см. from_columns):
+    тогда таблица только для чтения.
+    """
+
+    def __init__(self, cities: Iterable[City] = ()):
+        """
+        :param cities: города для начального заполнения
+        """
+        self._populations = array("q")
+        self._latitudes = array("d")
+        self._longitudes = array("d")
+        self._names = array("I")
+        self._subjects = array("I")
+        self._districts = array("I")
+        self._used = bytearray()
+        self._strings = StringTable()
+        # строка → индекс в _strings; нужен только при добавлении (см. compact)
+        self._string_ids: Optional[Dict[str, int]] = {}
+        self._read_only = False
+
+        for city in cities:
+            self.append(
+                city.name,
+                city.population,
+                city.subject,
+                city.district,
+                city.latitude,
+                city.longitude,
+            )
+
+    @classmethod
+    def from_columns(
+        cls,
+        populations: Sequence[int],
+        latitudes: Sequence[float],
+        longitudes: Sequence[float],
+        names: Sequence[int],
+        subjects: Sequence[int],
+        districts: Sequence[int],
+        strings: StringTable,
+    ) -> "CityTable":
+        """
+        Таблица поверх готовых столбцов (например, memoryview над mmap) без копирования
+        и без повторной проверки: данные уже проверены при записи.
+        Такая таблица только для чтения.
+        :param strings: таблица строк, на которую ссылаются names, subjects, districts
+        :return: CityTable
+        """
+        table = cls.__new__(cls)
+        table._populations = populations
+        table._latitudes = latitudes
+        table._longitudes = longitudes
+        table._names = names
+        table._subjects = subjects
+        table._districts = districts
+        table._used = bytearray(len(populations))
+        table._strings = strings
+        table._string_ids = None
+        table._read_only = True
+        return table
+
+    def _intern(self, value: str) -> int:
+        if self._string_ids is None:
+            self._string_ids = {s: i for i, s in enumerate(self._strings)}
+        index = self._string_ids.get(value)
+        if index is None:
+            index = self._strings.append(value)
+            self._string_ids[value] = index
+        return index
+
+    def compact(self) -> None:
+        """
+        Освобождает словарь интернирования строк, когда загрузка закончена
+        (в нём по записи на каждое уникальное название).
+        Следующее добавление построит его заново по таблице строк.
+        """
+        self._string_ids = None
+
+    def append(
+        self,
+        name: str,
+        population: int,
+        subject: str,
+        district: str,
+        latitude: float,
+        longitude: float,
+    ) -> "CityView":
+        """
+        Добавляет город в таблицу (с той же проверкой, что и City).
+        :return: представление добавленного города
+        """
+        validate_city_fields(name, population)
+        return self._append_row(name, population, subject, district, latitude, longitude)
+
+    def extend_rows(self, rows: Iterable[CityRow]) -> None:
+        """
+        Добавляет уже проверенные строки (например, из воркеров CitiesSerializer).
+        :param rows: кортежи (name, population, subject, district, latitude, longitude)
+        """
+        for row in rows:
+            self._append_row(*row)
+
+    def _append_row(
+        self,
+        name: str,
+        population: int,
+        subject: str,
+        district: str,
+        latitude: float,
+        longitude: float,
+    ) -> "CityView":
+        if self._read_only:
+            raise TypeError("Таблица только для чтения")
+        self._populations.append(population)
+        self._latitudes.append(latitude)
+        self._longitudes.append(longitude)
+        self._names.append(self._intern(name))
+        self._subjects.append(self._intern(subject))
+        self._districts.append(self._intern(district))
+        self._used.append(0)
+        return CityView(self, len(self._populations) - 1)
+
+    def __len__(self) -> int:
+        return len(self._populations)
+
+    def __getitem__(self, index: int) -> "CityView":
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Индекс города вне диапазона")
+        return CityView(self, index)
+
+    def __iter__(self) -> Iterator["CityView"]:
+        for index in range(len(self)):
+            yield CityView(self, index)
+
+    def get_all_cities(self) -> "CityTable":
+        """
+        Возвращает города (тот же интерфейс, что у CitiesSerializer):
+        саму таблицу — последовательность, которая создаёт CityView при обращении.
+        :return: CityTable
+        """
+        return self
+
+
+@total_ordering
+class CityView:
+    """
+    Лёгкое представление одной строки CityTable.
+    Ведёт себя как City: те же поля, сравнение по population.
+    """
+
+    __slots__ = ("_table", "_index")
+    __hash__ = None  # как у City: eq по населению, без хеша
+
+    def __init__(self, table: CityTable, index: int):
+        self._table = table
+        self._index = index
+
+    @property
+    def index(self) -> int:
+        """Номер строки в таблице."""
+        return self._index
+
+    @property
+    def name(self) -> str:
+        return self._table._strings[self._table._names[self._index]]
+
+    @property
+    def population(self) -> int:
+        return self._table._populations[self._index]
+
+    @property
+    def subject(self) -> str:
+        return self._table._strings[self._table._subjects[self._index]]
+
+    @property
+    def district(self) -> str:
+        return self._table._strings[self._table._districts[self._index]]
+
+    @property
+    def latitude(self) -> float:
+        return self._table._latitudes[self._index]
+
+    @property
+    def longitude(self) -> float:
+        return self._table._longitudes[self._index]
+
+    @property
+    def is_used(self) -> bool:
+        return bool(self._table._used[self._index])
+
+    @is_used.setter
+    def is_used(self, value: bool) -> None:
+        self._table._used[self._index] = 1 if value else 0
+
+    def __eq__(self, other):
+        if not isinstance(other, (City, CityView)):
+            return NotImplemented
+        return self.population == other.population
+
+    def __lt__(self, other):
+        if not isinstance(other, (City, CityView)):
+            return NotImplemented
+        return self.population < other.population
+
+    def to_city(self) -> City:
+        """
+        Создаёт полноценный объект City из представления.
+        :return: объект City
+        """
+        return City(
+            name=self.name,
+            population=self.population,
+            subject=self.subject,
+            district=self.district,
+            latitude=self.latitude,
+            longitude=self.longitude,
+            is_used=self.is_used,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"CityView(name={self.name!r}, population={self.population!r}, "
+            f"subject={self.subject!r}, district={self.district!r}, "
+            f"latitude={self.latitude!r}, longitude={self.longitude!r}, "
+            f"is_used={self.is_used!r})"
+        )
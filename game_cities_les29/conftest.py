@@ -0,0 +1,17 @@
+# conftest.py
+import os
+import sys
+
+# В game_cities_les28 и game_cities_les29 модули называются одинаково
+# (json_reader, city, ...). При общем запуске pytest из корня репозитория
+# убираем из кэша импорта одноимённые модули соседнего каталога,
+# чтобы тесты этого каталога импортировали свои.
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+for _file in os.listdir(_HERE):
+    _name, _ext = os.path.splitext(_file)
+    _module = sys.modules.get(_name)
+    if _ext != ".py" or _module is None or not getattr(_module, "__file__", None):
+        continue
+    if os.path.dirname(os.path.abspath(_module.__file__)) != _HERE:
+        del sys.modules[_name]
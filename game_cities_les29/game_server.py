@@ -0,0 +1,220 @@
+# game_server.py
+import argparse
+import asyncio
+import os
+import random
+import time
+import tracemalloc
+from typing import Dict, Optional, Set
+from city_game import CityGame
+from city_index import CityIndex
+from cities_serializer import CitiesSerializer
+from json_reader import JSONReader
+
+STOP_WORDS = ("стоп", "exit", "quit")
+
+
+class GameServer:
+    """
+    Асинхронный сервер игры "Города" для множества игроков.
+    Протокол построчный (UTF-8): клиент присылает город, сервер отвечает
+    одной из строк:
+    - "ERR <текст>" — ход не принят, можно повторить
+    - "CITY <город>" — ответ компьютера
+    - "WIN <текст>" / "LOSE <текст>" — игра окончена
+    - "BYE" — игрок вышел
+    Все сессии разделяют один неизменяемый CityIndex.
+    """
+
+    def __init__(self, city_index: CityIndex):
+        """
+        :param city_index: общий индекс городов
+        """
+        self.city_index = city_index
+        self.active_sessions = 0
+        self.total_sessions = 0
+        self.moves = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    def new_game(self) -> CityGame:
+        """Создаёт партию поверх общего индекса (без печати ошибок)."""
+        return CityGame(None, city_index=self.city_index, verbose=False)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """
+        Запускает сервер.
+        :return: фактический порт (полезно при port=0)
+        """
+        self._server = await asyncio.start_server(self._handle_client, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Останавливает сервер."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        game = self.new_game()
+        self.active_sessions += 1
+        self.total_sessions += 1
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                reply = self.play(game, line.decode("utf-8").strip())
+                writer.write(reply.encode("utf-8"))
+                await writer.drain()
+                if not reply.startswith(("ERR", "CITY")) or "\nLOSE" in reply:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self.active_sessions -= 1
+            writer.close()
+
+    def play(self, game: CityGame, user_input: str) -> str:
+        """
+        Обрабатывает один ход игрока (та же логика, что в GameManager.run_game).
+        :param game: партия сессии
+        :param user_input: строка от клиента
+        :return: ответ сервера (одна или две строки)
+        """
+        if user_input.lower() in STOP_WORDS:
+            return "BYE\n"
+
+        if not game.human_turn(user_input):
+            return f"ERR {game.last_error}\n"
+        self.moves += 1
+
+        if game.check_game_over():
+            return "WIN Компьютер не может ответить — вы победили!\n"
+
+        computer_city = game.computer_turn()
+        self.moves += 1
+        reply = f"CITY {computer_city}\n"
+        if game.check_game_over():
+            reply += "LOSE Вы не можете назвать город. Компьютер победил!\n"
+        return reply
+
+
+async def _play_client(
+    host: str, port: int, city_index: CityIndex, moves: int, rng: random.Random
+) -> int:
+    """
+    Клиент нагрузочного теста: ходит по индексу, помня названные города.
+    :return: число сделанных ходов игрока
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    cities = city_index.cities
+    seen: Set[str] = set()
+    city = rng.choice(cities)
+    made = 0
+    try:
+        for _ in range(moves):
+            seen.add(city.name)
+            writer.write(f"{city.name}\n".encode("utf-8"))
+            await writer.drain()
+            made += 1
+
+            reply = (await reader.readline()).decode("utf-8")
+            if not reply.startswith("CITY"):
+                break
+            answer = reply[5:].strip()
+            seen.add(answer)
+            letter = CityGame._get_last_letter(answer)
+            # города создаются по номерам строк, пока не найдётся свободный
+            city = next(
+                (
+                    cities[row]
+                    for row in city_index.rows_starting_with(letter)
+                    if cities[row].name not in seen
+                ),
+                None,
+            )
+            if city is None:
+                break
+        else:
+            writer.write("стоп\n".encode("utf-8"))
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+    return made
+
+
+async def run_load_test(
+    city_index: CityIndex, sessions: int = 1000, moves: int = 20, seed: int = 0
+) -> Dict[str, float]:
+    """
+    Нагрузочный тест на локальном TCP: sessions одновременных клиентов
+    по moves ходов каждый.
+    :return: сессий на ГБ памяти сервера и ходов в секунду
+    """
+    server = GameServer(city_index)
+    port = await server.start()
+    rng = random.Random(seed)
+
+    # память самих сессий: партии создаются заранее, общий индекс не учитывается
+    tracemalloc.start()
+    games = [server.new_game() for _ in range(sessions)]
+    for game in games:
+        game.human_turn(rng.choice(city_index.cities).name)
+        game.computer_turn()
+    per_session = tracemalloc.get_traced_memory()[0] / sessions
+    tracemalloc.stop()
+    del games
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(
+            _play_client("127.0.0.1", port, city_index, moves, random.Random(seed + i))
+            for i in range(sessions)
+        )
+    )
+    elapsed = time.perf_counter() - started
+    await server.stop()
+
+    return {
+        "sessions": sessions,
+        "moves": server.moves,
+        "seconds": elapsed,
+        "moves_per_second": server.moves / elapsed if elapsed else 0.0,
+        "bytes_per_session": per_session,
+        "sessions_per_gb": 2**30 / per_session if per_session else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Сервер игры 'Города'")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--load-test", type=int, metavar="SESSIONS", default=0)
+    parser.add_argument("--moves", type=int, default=20)
+    args = parser.parse_args()
+
+    file_path = os.path.join(os.path.dirname(__file__), "cities.json")
+    serializer = CitiesSerializer(JSONReader.iter_file(file_path))
+    city_index = CityIndex(serializer.get_all_cities())
+
+    if args.load_test:
+        stats = asyncio.run(run_load_test(city_index, args.load_test, args.moves))
+        for key, value in stats.items():
+            print(f"{key}: {value:,.1f}")
+        return
+
+    async def serve():
+        server = GameServer(city_index)
+        port = await server.start(args.host, args.port)
+        print(f"Сервер запущен на {args.host}:{port}")
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
 # json_reader.py
 import json
-from typing import List, Dict
+from typing import List, Dict, Iterator
+
+# Символы, которыми может продолжаться число (1.|5, 2|e3, 1e|-3)
+NUMBER_CHARS = frozenset("0123456789.eE+-")
 
 
 class JSONReader:
@@ -13,3 +16,86 @@ class JSONReader:
         """
         with open(filepath, "r", encoding="utf-8") as file:
             return json.load(file)
+
+    @staticmethod
+    def iter_file(filepath: str, chunk_size: int = 64 * 1024) -> Iterator[Dict]:
+        """
+        Потоково читает JSON-массив и отдаёт записи по одной.
+        В памяти держится только текущий кусок файла, а не весь документ.
+        :param filepath: путь к файлу
+        :param chunk_size: размер читаемого куска в символах
+        :return: генератор словарей с данными о городах
+        """
+        decoder = json.JSONDecoder()
+        with open(filepath, "r", encoding="utf-8") as file:
+            buffer = ""
+            pos = 0
+            eof = False
+
+            def fill() -> bool:
+                nonlocal buffer, pos, eof
+                chunk = file.read(chunk_size)
+                if not chunk:
+                    eof = True
+                    return False
+                buffer = buffer[pos:] + chunk
+                pos = 0
+                return True
+
+            def skip_whitespace() -> None:
+                nonlocal pos
+                while True:
+                    while pos < len(buffer) and buffer[pos].isspace():
+                        pos += 1
+                    if pos < len(buffer) or not fill():
+                        return
+
+            skip_whitespace()
+            if pos >= len(buffer) or buffer[pos] != "[":
+                raise json.JSONDecodeError("Ожидается JSON-массив", buffer, pos)
+            pos += 1
+
+            expect_item = True
+            seen_item = False
+            while True:
+                skip_whitespace()
+                if pos >= len(buffer):
+                    raise json.JSONDecodeError("Неожиданный конец файла", buffer, pos)
+                char = buffer[pos]
+                if char == "]":
+                    if expect_item and seen_item:
+                        raise json.JSONDecodeError("Лишняя запятая", buffer, pos)
+                    return
+                if char == ",":
+                    if expect_item:
+                        raise json.JSONDecodeError("Лишняя запятая", buffer, pos)
+                    pos += 1
+                    expect_item = True
+                    continue
+                if not expect_item:
+                    raise json.JSONDecodeError("Ожидается ',' или ']'", buffer, pos)
+
+                while True:
+                    try:
+                        item, end = decoder.raw_decode(buffer, pos)
+                    except json.JSONDecodeError:
+                        # запись обрезана границей куска — дочитываем
+                        if fill():
+                            continue
+                        raise
+                    # число на границе куска могло быть прочитано не целиком:
+                    # raw_decode вернёт префикс (1 из "1.", 2 из "2e")
+                    if (
+                        not eof
+                        and isinstance(item, (int, float))
+                        and not isinstance(item, bool)
+                        and all(c in NUMBER_CHARS for c in buffer[end:])
+                        and fill()
+                    ):
+                        continue
+                    break
+
+                pos = end
+                expect_item = False
+                seen_item = True
+                yield item
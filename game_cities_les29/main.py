@@ -3,7 +3,9 @@ from json_reader import JSONReader
 from cities_serializer import CitiesSerializer
 from city_game import CityGame
 from game_manager import GameManager
+from city_snapshot import CitySnapshot
 import os
+import struct
 
 
 def main():
@@ -15,14 +17,34 @@ def main():
         print("👉 Убедитесь, что 'cities.json' лежит в той же папке, что и 'main.py'.")
         return
 
-    try:
-        reader = JSONReader()
-        data = reader.read_file(file_path)
-    except Exception as e:
-        print(f"❌ Ошибка чтения JSON: {e}")
-        return
+    snapshot_path = os.path.join(os.path.dirname(__file__), "cities.bin")
+
+    serializer = None
+    if CitySnapshot.is_fresh(snapshot_path, file_path):
+        # 🔹 Снимок новее JSON — загружаем его без разбора JSON
+        try:
+            serializer = CitySnapshot.load(snapshot_path)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"⚠️ Снимок городов не читается ({e}), пересобираем из JSON.")
+
+    if serializer is None:
+        try:
+            reader = JSONReader()
+            # Потоковое чтение: записи идут в сериализатор по одной
+            serializer = CitiesSerializer(reader.iter_file(file_path))
+        except Exception as e:
+            print(f"❌ Ошибка чтения JSON: {e}")
+            return
+
+        errors = serializer.get_errors()
+        if errors:
+            print(f"⚠️ Пропущено некорректных записей: {len(errors)}")
+
+        try:
+            CitySnapshot.compile(serializer.get_all_cities(), snapshot_path)
+        except OSError as e:
+            print(f"⚠️ Не удалось сохранить снимок городов: {e}")
 
-    serializer = CitiesSerializer(data)
     game = CityGame(serializer)
     manager = GameManager(serializer, game)
 
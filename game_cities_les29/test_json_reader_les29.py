@@ -0,0 +1,37 @@
+# test_json_reader_les29.py
+import json
+import pytest
+from json_reader import JSONReader
+
+DOCUMENTS = [
+    "  [1.5e3]",
+    "[" + "0," * 40 + " 1.5]",
+    '[{"lat": -12.25E-2, "n": 2e3}, 10, -0.5, true, null, "1.5", []]',
+    "[ 123456789 , 1e+10,\n 0.000001 ]",
+    "[]",
+]
+
+
+@pytest.mark.parametrize("text", DOCUMENTS)
+def test_iter_file_matches_json_load_for_any_chunk_size(tmp_path, text):
+    path = tmp_path / "data.json"
+    path.write_text(text, encoding="utf-8")
+    expected = json.loads(text)
+    for chunk_size in range(1, len(text) + 2):
+        assert list(JSONReader.iter_file(str(path), chunk_size)) == expected, chunk_size
+
+
+def test_iter_file_number_on_default_chunk_boundary(tmp_path):
+    text = "[" + "0," * 32766 + " 1.5]"
+    path = tmp_path / "data.json"
+    path.write_text(text, encoding="utf-8")
+    assert list(JSONReader.iter_file(str(path))) == json.loads(text)
+
+
+@pytest.mark.parametrize("text", ["[1,]", "[1 2]", "[1", "{}", "[,1]"])
+def test_iter_file_rejects_invalid_json(tmp_path, text):
+    path = tmp_path / "data.json"
+    path.write_text(text, encoding="utf-8")
+    for chunk_size in range(1, len(text) + 2):
+        with pytest.raises(json.JSONDecodeError):
+            list(JSONReader.iter_file(str(path), chunk_size))
@@ -1,6 +1,160 @@
 # palindrome_checker.py
+import re
+import time
+import unicodedata
 from abc import ABC, abstractmethod
-from typing import Protocol
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import compress
+from typing import Dict, Iterable, Iterator, List, Optional, Protocol, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy нужен только для пакетной проверки с use_numpy=True
+    np = None
+
+
+def is_mirror(text: str) -> bool:
+    """
+    Сравнивает строку с её зеркальным отражением двумя указателями,
+    без создания перевёрнутой копии; останавливается на первом несовпадении.
+    :param text: уже нормализованная строка
+    :return: True, если строка читается одинаково в обе стороны
+    """
+    left, right = 0, len(text) - 1
+    while left < right:
+        if text[left] != text[right]:
+            return False
+        left += 1
+        right -= 1
+    return True
+
+
+# Буквы, которые при сравнении считаются одинаковыми
+LETTER_FOLDS = {"ё": "е"}
+
+
+class _FoldTable(dict):
+    """
+    Таблица для str.translate: кодовая точка → замена (None — удалить).
+    Решение для каждого символа принимается один раз при первой встрече
+    и запоминается, поэтому таблица не строится по всему Unicode заранее.
+    """
+
+    def __init__(self, ignore_spaces: bool, strip_punctuation: bool):
+        super().__init__()
+        self.ignore_spaces = ignore_spaces
+        self.strip_punctuation = strip_punctuation
+
+    def __missing__(self, code: int) -> Optional[int]:
+        char = chr(code)
+        category = unicodedata.category(char)
+        if char in LETTER_FOLDS:
+            result = ord(LETTER_FOLDS[char])
+        elif category.startswith("M"):
+            result = None  # знаки, не собравшиеся после NFKC в одну букву
+        elif char.isspace():
+            result = None if self.ignore_spaces else code
+        elif self.strip_punctuation and category[0] in "PS":
+            result = None
+        else:
+            result = code
+        self[code] = result
+        return result
+
+
+class TextNormalizer:
+    """
+    Нормализация текста для проверки палиндромов:
+    NFKC (только для не-ASCII строк) → casefold → translate по таблице,
+    которая заменяет ё на е, удаляет оставшиеся комбинируемые знаки,
+    а также (по настройке) пробельные символы и знаки препинания.
+    NFKC раскрывает лигатуры (ﬁ → fi) и собирает буквы с диакритикой,
+    поэтому й остаётся й, а е + U+0308 становится ё → е.
+    """
+
+    def __init__(self, ignore_spaces: bool, strip_punctuation: bool):
+        """
+        :param ignore_spaces: удалять пробельные символы
+        :param strip_punctuation: удалять знаки препинания и символы
+        """
+        self._table = _FoldTable(ignore_spaces, strip_punctuation)
+
+    def __call__(self, text: str) -> str:
+        if not text.isascii():
+            text = unicodedata.normalize("NFKC", text)
+        return text.casefold().translate(self._table)
+
+
+@lru_cache(maxsize=None)
+def get_normalizer(ignore_spaces: bool, strip_punctuation: bool) -> TextNormalizer:
+    """
+    Возвращает общий нормализатор для данной конфигурации
+    (таблица замен кэшируется и переиспользуется всеми стратегиями).
+    """
+    return TextNormalizer(ignore_spaces, strip_punctuation)
+
+
+# Виды символов для _CharKinds: удаляется, остаётся одним символом,
+# меняет длину при нормализации, присоединяется к предыдущему символу
+_DROPPED, _SINGLE, _EXPANDS, _JOINS = "\x00", "\x01", "\x02", "\x03"
+# Фрагменты, которые нормализуются целиком: символ с присоединёнными знаками
+# или символ, меняющий длину (ß → ss, ﬁ → fi)
+_CLUSTER = re.compile("[^\x03]?\x03+|\x02")
+
+
+def _joins_previous(char: str) -> bool:
+    """
+    Может ли символ при NFKC слиться с предыдущим: комбинируемые знаки,
+    символы, раскрывающиеся в такой знак (полуширинные дакутэн/хандакутэн),
+    гласные и конечные согласные хангыля.
+    """
+    if unicodedata.category(char).startswith("M"):
+        return True
+    if 0x1161 <= ord(char) <= 0x11C2:
+        return True
+    decomposed = unicodedata.normalize("NFKD", char)
+    return bool(decomposed) and unicodedata.combining(decomposed[0]) != 0
+
+
+class _CharKinds(dict):
+    """
+    Таблица для str.translate: кодовая точка → вид символа (_DROPPED, ...).
+    Заодно заполняет folds — свёртку символов, которые нормализуются
+    независимо от соседей (кодовая точка → символ или "" для удаляемых).
+    Как и _FoldTable, заполняется по мере встречи символов.
+    """
+
+    def __init__(self, normalize: TextNormalizer):
+        super().__init__()
+        self._normalize = normalize
+        self.folds: Dict[int, str] = {}
+
+    def __missing__(self, code: int) -> str:
+        char = chr(code)
+        if _joins_previous(char):
+            kind = _JOINS
+        else:
+            folded = self._normalize(char)
+            if len(folded) > 1:
+                kind = _EXPANDS
+            else:
+                kind = _SINGLE if folded else _DROPPED
+                self.folds[code] = folded
+        self[code] = kind
+        return kind
+
+
+@lru_cache(maxsize=None)
+def _get_char_kinds(ignore_spaces: bool, strip_punctuation: bool) -> _CharKinds:
+    """Общая таблица видов символов для данной конфигурации нормализатора."""
+    return _CharKinds(get_normalizer(ignore_spaces, strip_punctuation))
+
+
+def _index_typecode(length: int) -> str:
+    """Тип элементов array для индексов строки длины length."""
+    return "i" if length < 2**31 else "q"
 
 
 class PalindromeStrategy(Protocol):
@@ -11,19 +165,43 @@ class PalindromeStrategy(Protocol):
     def is_palindrome(self, text: str) -> bool: ...
 
 
+class PalindromeSearchStrategy(Protocol):
+    """
+    Интерфейс стратегий поиска палиндромов внутри строки.
+    """
+
+    def longest(self, text: str) -> str: ...
+
+    def maximal(self, text: str, min_length: int = 2) -> Iterator[Tuple[int, int]]: ...
+
+
 class SingleWordPalindrome:
     """
     Стратегия проверки одиночного слова на палиндром (без учёта регистра).
     """
 
+    def __init__(self, strip_punctuation: bool = True):
+        """
+        :param strip_punctuation: игнорировать знаки препинания
+        """
+        self._normalize = get_normalizer(False, strip_punctuation)
+
+    def normalize(self, text: str) -> str:
+        """
+        Приводит слово к виду для сравнения.
+        :param text: строка (одно слово)
+        :return: нормализованная строка
+        """
+        return self._normalize(text.strip())
+
     def is_palindrome(self, text: str) -> bool:
         """
         Проверяет, является ли слово палиндромом.
         :param text: строка (одно слово)
         :return: True, если слово — палиндром
         """
-        clean = text.strip().lower()
-        return clean == clean[::-1]
+        clean = self.normalize(text)
+        return bool(clean) and is_mirror(clean)
 
 
 class MultiWordPalindrome:
@@ -32,14 +210,173 @@ class MultiWordPalindrome:
     Игнорирует пробелы и регистр.
     """
 
+    def __init__(self, strip_punctuation: bool = True):
+        """
+        :param strip_punctuation: игнорировать знаки препинания
+        """
+        self._normalize = get_normalizer(True, strip_punctuation)
+
+    def normalize(self, text: str) -> str:
+        """
+        Приводит фразу к виду для сравнения: без пробелов и регистра.
+        :param text: строка (фраза)
+        :return: нормализованная строка
+        """
+        return self._normalize(text)
+
     def is_palindrome(self, text: str) -> bool:
         """
         Проверяет, является ли фраза палиндромом.
         :param text: строка (фраза)
         :return: True, если фраза — палиндром
         """
-        clean = "".join(text.split()).lower()
-        return clean == clean[::-1]
+        clean = self.normalize(text)
+        return bool(clean) and is_mirror(clean)
+
+
+class ManacherPalindromeSearch:
+    """
+    Стратегия поиска палиндромных подстрок алгоритмом Манакера за O(n).
+    Нормализация как в MultiWordPalindrome: без учёта регистра и пробелов;
+    по желанию также без знаков препинания. Найденные палиндромы
+    возвращаются как фрагменты исходного текста.
+    """
+
+    def __init__(self, strip_punctuation: bool = False):
+        """
+        :param strip_punctuation: игнорировать всё, кроме букв и цифр
+        """
+        self.strip_punctuation = strip_punctuation
+        self._normalize = get_normalizer(True, strip_punctuation)
+        self._kinds = _get_char_kinds(True, strip_punctuation)
+
+    def _prepare(self, text: str) -> Tuple[str, array, Dict[int, int]]:
+        """
+        Нормализует текст и запоминает, из какого фрагмента text
+        получен каждый символ.
+        Символы, которые нормализуются независимо от соседей, сворачиваются
+        одним проходом str.translate по кэшированным таблицам, а их позиции
+        берутся из маски оставшихся символов. Отдельно нормализуются только
+        кластеры «буква + комбинируемые знаки» и символы, меняющие длину
+        (ß → ss, ﬁ → fi).
+        :return: нормализованная строка, начала фрагментов для каждого её
+            символа и концы тех фрагментов, что длиннее одного символа
+            (остальные заканчиваются на начало + 1)
+        """
+        kinds_table = self._kinds
+        folds = kinds_table.folds
+        kinds = text.translate(kinds_table)
+        typecode = _index_typecode(len(text) + 1)
+        if _EXPANDS not in kinds and _JOINS not in kinds:
+            mask = kinds.encode("latin-1")
+            starts = array(typecode, compress(range(len(text)), mask))
+            return text.translate(folds), starts, {}
+
+        starts = array(typecode)
+        ends = {}
+        parts = []
+        position = 0
+        for match in _CLUSTER.finditer(kinds):
+            start, end = match.span()
+            if position < start:
+                parts.append(text[position:start].translate(folds))
+                mask = kinds[position:start].encode("latin-1")
+                starts.extend(array(typecode, compress(range(position, start), mask)))
+            folded = self._normalize(text[start:end])
+            for _ in folded:
+                ends[len(starts)] = end
+                starts.append(start)
+            parts.append(folded)
+            position = end
+        if position < len(text):
+            parts.append(text[position:].translate(folds))
+            mask = kinds[position:].encode("latin-1")
+            starts.extend(array(typecode, compress(range(position, len(text)), mask)))
+        return "".join(parts), starts, ends
+
+    @staticmethod
+    def _radii(clean: str) -> Tuple[array, array]:
+        """
+        Алгоритм Манакера.
+        :return: odd[i] — число палиндромов нечётной длины с центром i,
+            even[i] — число палиндромов чётной длины с правым центром i
+        """
+        n = len(clean)
+        typecode = _index_typecode(n + 1)
+        odd = array(typecode, [0]) * n
+        even = array(typecode, [0]) * n
+
+        left, right = 0, -1
+        for i in range(n):
+            k = 1 if i > right else min(odd[left + right - i], right - i + 1)
+            while i - k >= 0 and i + k < n and clean[i - k] == clean[i + k]:
+                k += 1
+            odd[i] = k
+            if i + k - 1 > right:
+                left, right = i - k + 1, i + k - 1
+
+        left, right = 0, -1
+        for i in range(n):
+            k = 0 if i > right else min(even[left + right - i + 1], right - i + 1)
+            while i - k - 1 >= 0 and i + k < n and clean[i - k - 1] == clean[i + k]:
+                k += 1
+            even[i] = k
+            if i + k - 1 > right:
+                left, right = i - k, i + k - 1
+        return odd, even
+
+    def is_palindrome(self, text: str) -> bool:
+        """
+        Проверяет, является ли весь текст палиндромом (по тем же правилам).
+        :param text: строка для проверки
+        :return: True, если текст — палиндром
+        """
+        clean, _, _ = self._prepare(text)
+        return bool(clean) and is_mirror(clean)
+
+    def maximal(self, text: str, min_length: int = 2) -> Iterator[Tuple[int, int]]:
+        """
+        Перечисляет максимальные палиндромы для каждого центра.
+        :param text: исходный текст
+        :param min_length: минимальная длина (в нормализованных символах)
+        :return: пары (начало, конец) — срезы исходного текста text[начало:конец]
+        """
+        clean, starts, ends = self._prepare(text)
+        odd, even = self._radii(clean)
+        for i in range(len(clean)):
+            if even[i] and 2 * even[i] >= min_length:
+                last = i + even[i] - 1
+                yield starts[i - even[i]], ends.get(last, starts[last] + 1)
+            if 2 * odd[i] - 1 >= min_length:
+                last = i + odd[i] - 1
+                yield starts[i - odd[i] + 1], ends.get(last, starts[last] + 1)
+
+    def longest(self, text: str) -> str:
+        """
+        Находит самый длинный палиндромный фрагмент (первый при равенстве длин).
+        :param text: исходный текст
+        :return: фрагмент исходного текста или пустая строка
+        """
+        clean, starts, ends = self._prepare(text)
+        if not clean:
+            return ""
+        odd, even = self._radii(clean)
+
+        best_length, best_start = 0, 0
+        for i in range(len(clean)):
+            length = 2 * odd[i] - 1
+            if length > best_length:
+                best_length, best_start = length, i - odd[i] + 1
+            length = 2 * even[i]
+            if length > best_length:
+                best_length, best_start = length, i - even[i]
+        last = best_start + best_length - 1
+        return text[starts[best_start] : ends.get(last, starts[last] + 1)]
+
+
+# Стратегии не хранят состояния, поэтому переиспользуются всеми фасадами
+SINGLE_WORD = SingleWordPalindrome()
+MULTI_WORD = MultiWordPalindrome()
 
 
 class PalindromeContext:
@@ -69,6 +406,87 @@ class PalindromeContext:
         """
         return self._strategy.is_palindrome(text)
 
+    def longest(self, text: str) -> str:
+        """
+        Ищет самый длинный палиндромный фрагмент текста.
+        Требует стратегию поиска (например, ManacherPalindromeSearch).
+        :param text: строка для поиска
+        :return: найденный фрагмент
+        """
+        return self._strategy.longest(text)
+
+    def maximal(self, text: str, min_length: int = 2) -> Iterator[Tuple[int, int]]:
+        """
+        Перечисляет максимальные палиндромы текста (нужна стратегия поиска).
+        :param text: строка для поиска
+        :param min_length: минимальная длина палиндрома
+        :return: пары (начало, конец) в исходном тексте
+        """
+        return self._strategy.maximal(text, min_length)
+
+
+class PalindromeCache:
+    """
+    Ограниченный LRU-кэш результатов проверки с необязательным TTL.
+    Считает попадания, промахи и вытеснения.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        """
+        :param maxsize: максимальное число записей
+        :param ttl: время жизни записи в секундах (None — без ограничения)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[bool, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[bool]:
+        """
+        Возвращает сохранённый результат или None (промах).
+        :param key: проверяемый текст
+        """
+        entry = self._data.get(key)
+        if entry is not None:
+            value, expires = entry
+            if self.ttl is None or expires > time.monotonic():
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._data[key]
+            self.evictions += 1
+        self.misses += 1
+        return None
+
+    def put(self, key: str, value: bool) -> None:
+        """
+        Сохраняет результат, вытесняя самую давнюю запись при переполнении.
+        :param key: проверяемый текст
+        :param value: результат проверки
+        """
+        expires = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+        self._data[key] = (value, expires)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Счётчики кэша.
+        :return: словарь с hits, misses, evictions, size и hit_rate
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._data),
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
 
 class PalindromeFacade:
     """
@@ -76,9 +494,32 @@ class PalindromeFacade:
     Автоматически выбирает стратегию в зависимости от количества слов.
     """
 
-    def __init__(self):
-        """Инициализация фасада с контекстом."""
-        self._context = PalindromeContext(SingleWordPalindrome())
+    def __init__(self, cache_size: int = 0, cache_ttl: Optional[float] = None):
+        """
+        Инициализация фасада с контекстом.
+        :param cache_size: размер кэша результатов (0 — кэш выключен)
+        :param cache_ttl: время жизни записи кэша в секундах
+        """
+        self._context = PalindromeContext(SINGLE_WORD)
+        self._cache: Optional[PalindromeCache] = (
+            PalindromeCache(cache_size, cache_ttl) if cache_size > 0 else None
+        )
+
+    def cache_stats(self) -> Optional[Dict[str, float]]:
+        """
+        Статистика кэша или None, если кэш выключен.
+        """
+        return self._cache.stats() if self._cache is not None else None
+
+    @staticmethod
+    def _pick_strategy(text: str):
+        """
+        Выбирает стратегию по количеству слов (без создания списка слов).
+        :param text: непустая строка
+        :return: SINGLE_WORD или MULTI_WORD
+        """
+        stripped = text.strip()
+        return MULTI_WORD if len(stripped.split(maxsplit=1)) > 1 else SINGLE_WORD
 
     def check_palindrome(self, text: str) -> bool:
         """
@@ -92,13 +533,63 @@ class PalindromeFacade:
         if not text or not text.strip():
             return False
 
-        words = text.strip().split()
-        if len(words) == 1:
-            self._context.set_strategy(SingleWordPalindrome())
-        else:
-            self._context.set_strategy(MultiWordPalindrome())
+        # Ключ — исходный текст: при попадании не нужны ни нормализация, ни сравнение
+        if self._cache is not None:
+            cached = self._cache.get(text)
+            if cached is not None:
+                return cached
+
+        self._context.set_strategy(self._pick_strategy(text))
+        result = self._context.check(text)
+
+        if self._cache is not None:
+            self._cache.put(text, result)
+        return result
+
+    def check_many(self, texts: Iterable[str], use_numpy: bool = False) -> List[bool]:
+        """
+        Проверяет набор строк за один проход.
+        Стратегия выбирается для каждой строки так же, как в check_palindrome.
+        :param texts: строки для проверки (список, генератор, файл и т.п.)
+        :param use_numpy: сравнивать кодовые точки векторно (нужен NumPy);
+            выгодно на больших наборах строк одинаковой длины
+        :return: список результатов в исходном порядке
+        """
+        if not use_numpy:
+            if self._cache is not None:
+                return [self.check_palindrome(text) for text in texts]
+            results = []
+            for text in texts:
+                if not text or not text.strip():
+                    results.append(False)
+                else:
+                    results.append(self._pick_strategy(text).is_palindrome(text))
+            return results
+
+        if np is None:
+            raise ImportError("Для use_numpy=True требуется пакет numpy")
+
+        results = []
+        # длина нормализованной строки → [(позиция, строка)]
+        groups: Dict[int, List[tuple]] = {}
+        for position, text in enumerate(texts):
+            if not text or not text.strip():
+                results.append(False)
+                continue
+            clean = self._pick_strategy(text).normalize(text)
+            # строка из одних знаков препинания палиндромом не считается
+            results.append(bool(clean))
+            groups.setdefault(len(clean), []).append((position, clean))
 
-        return self._context.check(text)
+        for length, items in groups.items():
+            if length < 2:
+                continue
+            encoded = "".join(clean for _, clean in items).encode("utf-32-le")
+            codes = np.frombuffer(encoded, dtype=np.uint32).reshape(len(items), length)
+            mirrored = (codes == codes[:, ::-1]).all(axis=1)
+            for (position, _), ok in zip(items, mirrored):
+                results[position] = bool(ok)
+        return results
 
 
 # ——————————————————————————————————————————
@@ -0,0 +1,165 @@
+# palindrome_scanner.py
+import mmap
+import os
+import sys
+from array import array
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from palindrome_checker import MULTI_WORD
+
+# Размер куска файла для одного воркера (граница сдвигается к концу строки)
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+def _chunk_bounds(path: str, chunk_size: int) -> List[Tuple[int, int]]:
+    """
+    Делит файл на диапазоны байт, выровненные по границам строк.
+    :param path: путь к файлу
+    :param chunk_size: желаемый размер диапазона
+    :return: список пар (начало, конец)
+    """
+    size = os.path.getsize(path)
+    bounds = []
+    start = 0
+    with open(path, "rb") as file:
+        while start < size:
+            file.seek(min(start + chunk_size, size))
+            file.readline()  # дочитываем строку, на которую попала граница
+            end = min(file.tell(), size)
+            bounds.append((start, end))
+            start = end
+    return bounds
+
+
+def _check_encoding(encoding: str) -> None:
+    """
+    Строки ищутся по байту b"\\n", поэтому подходят только кодировки,
+    совместимые с ASCII (utf-8, cp1251, koi8-r, ...). В UTF-16/32 такой
+    поиск режет кодовые единицы пополам.
+    Вызывает ValueError для остальных кодировок.
+    """
+    ascii_bytes = bytes(range(128))
+    try:
+        compatible = ascii_bytes.decode(encoding) == ascii_bytes.decode("ascii")
+    except UnicodeDecodeError:
+        compatible = False
+    if not compatible:
+        raise ValueError(f"Кодировка {encoding} не совместима с ASCII")
+
+
+def _map_bounded(
+    pool: Executor, func, items: Iterable, window: int
+) -> Iterator:
+    """
+    Аналог pool.map, который держит в работе не более window задач:
+    Executor.map сразу отправляет все куски, и их результаты копятся
+    в памяти. Результаты идут в исходном порядке.
+    """
+    pending = deque()
+    for item in items:
+        pending.append(pool.submit(func, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _scan_chunk(args: Tuple[str, int, int, str]) -> Tuple[array, int]:
+    """
+    Проверяет строки в диапазоне файла (выполняется в процессе-воркере).
+    :param args: путь, начало, конец диапазона, кодировка
+    :return: смещения строк-палиндромов и число просмотренных строк
+    """
+    path, start, end, encoding = args
+    offsets = array("q")
+    lines = 0
+    with open(path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            position = start
+            while position < end:
+                newline = data.find(b"\n", position, end)
+                line_end = end if newline == -1 else newline
+                line = data[position:line_end].decode(encoding, errors="replace")
+                lines += 1
+                if line.strip() and MULTI_WORD.is_palindrome(line):
+                    offsets.append(position)
+                position = line_end + 1
+    return offsets, lines
+
+
+def scan_file(
+    path: str,
+    output_path: str,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8",
+) -> Dict[str, int]:
+    """
+    Потоково ищет строки-палиндромы (правила MultiWordPalindrome) в большом файле.
+    Файл делится на куски по границам строк, куски обрабатываются пулом
+    процессов через mmap. В output_path пишутся байтовые смещения начала
+    строк-палиндромов: int64, little-endian, по возрастанию.
+    :param path: путь к текстовому файлу
+    :param output_path: путь к файлу результатов
+    :param workers: число процессов (None — по числу ядер, 1 — без пула)
+    :param chunk_size: размер куска в байтах
+    :param encoding: кодировка текста (совместимая с ASCII)
+    :return: статистика {"lines", "palindromes"}
+    """
+    _check_encoding(encoding)
+    if os.path.getsize(path) == 0:
+        open(output_path, "wb").close()
+        return {"lines": 0, "palindromes": 0}
+
+    tasks = [
+        (path, start, end, encoding) for start, end in _chunk_bounds(path, chunk_size)
+    ]
+    stats = {"lines": 0, "palindromes": 0}
+
+    with open(output_path, "wb") as output:
+        if workers == 1:
+            for offsets, lines in map(_scan_chunk, tasks):
+                _write_offsets(output, offsets, lines, stats)
+        else:
+            window = 2 * (workers or os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # Результаты идут в порядке кусков, файл остаётся отсортированным
+                for offsets, lines in _map_bounded(pool, _scan_chunk, tasks, window):
+                    _write_offsets(output, offsets, lines, stats)
+    return stats
+
+
+def _write_offsets(output, offsets: array, lines: int, stats: Dict[str, int]) -> None:
+    if sys.byteorder != "little":
+        offsets.byteswap()
+    offsets.tofile(output)
+    stats["lines"] += lines
+    stats["palindromes"] += len(offsets)
+
+
+def read_offsets(output_path: str) -> array:
+    """
+    Читает файл результатов scan_file.
+    :param output_path: путь к файлу результатов
+    :return: массив смещений строк-палиндромов
+    """
+    offsets = array("q")
+    with open(output_path, "rb") as file:
+        offsets.frombytes(file.read())
+    if sys.byteorder != "little":
+        offsets.byteswap()
+    return offsets
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Поиск строк-палиндромов в файле")
+    parser.add_argument("path")
+    parser.add_argument("output")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    result = scan_file(args.path, args.output, workers=args.workers)
+    print(f"Строк: {result['lines']}, палиндромов: {result['palindromes']}")
@@ -3,6 +3,8 @@ REST API для барбершопа на Flask и PeeWee ORM
 Реализует CRUD для мастеров и записей
 """
 
+import base64
+import json
 from datetime import datetime
 from flask import Flask, request, jsonify
 from peewee import (
@@ -75,6 +77,54 @@ def appointment_to_dict(appointment: Appointment) -> dict:
     }
 
 
+# === Пагинация ===
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+APPOINTMENT_FIELDS = ["id", "client_name", "client_phone", "date", "master", "status"]
+
+
+def encode_cursor(sort_value, appointment_id: int) -> str:
+    """Кодирует позицию последней записи страницы в непрозрачный курсор."""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_value, appointment_id], ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, sort_by: str) -> tuple:
+    """
+    Раскодирует курсор.
+    Возвращает (значение поля сортировки, id) или вызывает ValueError.
+    """
+    try:
+        sort_value, appointment_id = json.loads(
+            base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        )
+        appointment_id = int(appointment_id)
+        if sort_by == "date":
+            sort_value = datetime.fromisoformat(sort_value)
+    except (ValueError, TypeError, UnicodeError):
+        raise ValueError("Некорректный cursor")
+    return sort_value, appointment_id
+
+
+def appointment_row_to_dict(row: dict, fields: list) -> dict:
+    """Преобразует строку выборки (.dicts()) в словарь только с нужными полями."""
+    result = {}
+    for field in fields:
+        if field == "master":
+            result["master"] = {
+                "id": row["master_id"],
+                "first_name": row["master_first_name"],
+                "last_name": row["master_last_name"],
+            }
+        elif field == "date":
+            result["date"] = row["date"].strftime("%Y-%m-%d %H:%M:%S")
+        else:
+            result[field] = row[field]
+    return result
+
+
 # === Функции валидации ===
 def validate_master_data(dict) -> tuple[bool, str]:
     """Проверяет корректность данных для мастера."""
@@ -230,7 +280,11 @@ def delete_master(master_id: int):
 # === Маршруты: Appointment ===
 @app.route("/appointments", methods=["GET"])
 def get_appointments():
-    """Получить все записи с опциональной сортировкой."""
+    """
+    Получить записи постранично с возможной сортировкой.
+    Параметры: sort_by, direction, limit (не более MAX_PAGE_SIZE),
+    cursor (из next_cursor предыдущей страницы), fields (через запятую).
+    """
     try:
         sort_by = request.args.get("sort_by", "id")
         direction = request.args.get("direction", "asc").lower()
@@ -241,20 +295,79 @@ def get_appointments():
             "client_name": Appointment.client_name,
             "status": Appointment.status,
         }
-
-        query = Appointment.select().join(Master)
-
-        if sort_by in valid_sort_fields:
-            field = valid_sort_fields[sort_by]
-            if direction == "desc":
-                query = query.order_by(field.desc())
+        if sort_by not in valid_sort_fields:
+            sort_by = "id"
+        descending = direction == "desc"
+        sort_field = valid_sort_fields[sort_by]
+
+        try:
+            limit = int(request.args.get("limit", DEFAULT_PAGE_SIZE))
+        except ValueError:
+            return jsonify({"error": "limit должен быть целым числом"}), 400
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+        fields_arg = request.args.get("fields")
+        if fields_arg:
+            fields = [f.strip() for f in fields_arg.split(",") if f.strip()]
+            unknown = [f for f in fields if f not in APPOINTMENT_FIELDS]
+            if unknown:
+                return (
+                    jsonify({"error": f"Неизвестные поля: {', '.join(unknown)}"}),
+                    400,
+                )
+        else:
+            fields = APPOINTMENT_FIELDS
+
+        # Выбираем только нужные столбцы (+ id и поле сортировки для курсора)
+        columns = [Appointment.id]
+        for name in ["client_name", "client_phone", "date", "status"]:
+            if name in fields or name == sort_by:
+                columns.append(getattr(Appointment, name))
+        query = Appointment.select(*columns)
+        if "master" in fields:
+            query = query.join(Master).select_extend(
+                Master.id.alias("master_id"),
+                Master.first_name.alias("master_first_name"),
+                Master.last_name.alias("master_last_name"),
+            )
+
+        # Keyset-пагинация: продолжаем строго после последней записи страницы
+        cursor = request.args.get("cursor")
+        if cursor:
+            try:
+                last_value, last_id = decode_cursor(cursor, sort_by)
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
+            if sort_by == "id":
+                query = query.where(
+                    Appointment.id < last_id if descending else Appointment.id > last_id
+                )
+            elif descending:
+                query = query.where(
+                    (sort_field < last_value)
+                    | ((sort_field == last_value) & (Appointment.id < last_id))
+                )
             else:
-                query = query.order_by(field.asc())
+                query = query.where(
+                    (sort_field > last_value)
+                    | ((sort_field == last_value) & (Appointment.id > last_id))
+                )
+
+        if descending:
+            query = query.order_by(sort_field.desc(), Appointment.id.desc())
         else:
-            query = query.order_by(Appointment.id.asc())
+            query = query.order_by(sort_field.asc(), Appointment.id.asc())
+
+        rows = list(query.limit(limit + 1).dicts())
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last[sort_by], last["id"])
+
+        result = [appointment_row_to_dict(row, fields) for row in rows]
+        return jsonify({"appointments": result, "next_cursor": next_cursor}), 200
 
-        result = [appointment_to_dict(a) for a in query]
-        return jsonify({"appointments": result}), 200
     except Exception as e:
         print(f"Ошибка при получении записей: {e}")
         return (
@@ -1,5 +1,6 @@
-from flask import Flask
-from models import DB, Master, Appointment
+import os
+from flask import Flask, jsonify
+from models import DB, Master, Appointment, QueryBudgetExceeded
 from blueprints.masters.routes import masters_bp
 from blueprints.appointments.routes import appointments_bp
 import auth
@@ -12,22 +13,55 @@ print("=== END DEBUG ===")
 app = Flask(__name__)
 app.config["JSON_AS_ASCII"] = False
 app.url_map.strict_slashes = False
+# Отладочный бюджет SQL-запросов на один HTTP-запрос (None — не проверять)
+app.config["QUERY_BUDGET"] = (
+    int(os.environ["QUERY_BUDGET"]) if os.environ.get("QUERY_BUDGET") else None
+)
 
 app.register_blueprint(masters_bp)
 app.register_blueprint(appointments_bp)
 
 
-@app.before_request
-def create_tables():
-    DB.connect()
+# Схема создаётся один раз при запуске, а не на каждый запрос
+with DB.connection_context():
     DB.create_tables([Master, Appointment], safe=True)
 
 
+@app.before_request
+def open_db():
+    # Берём соединение из пула (новое открывается, только если свободных нет)
+    DB.connect(reuse_if_open=True)
+    # Запрос сверх бюджета падает до выполнения, т.е. до фиксации изменений
+    DB.reset_query_count(app.config.get("QUERY_BUDGET"))
+
+
+@app.errorhandler(QueryBudgetExceeded)
+def query_budget_exceeded(e):
+    return jsonify({"error": str(e)}), 500
+
+
+@app.after_request
+def add_query_count(response):
+    # Число SQL-запросов видно в заголовке
+    response.headers["X-Query-Count"] = str(DB.query_count())
+    return response
+
+
 @app.teardown_request
 def close_db(_):
+    # Бюджет действует только внутри HTTP-запроса
+    DB.reset_query_count()
+    # Возвращаем соединение в пул
     if not DB.is_closed():
         DB.close()
 
 
+@app.route("/db/stats", methods=["GET"])
+@auth.require_admin
+def db_stats():
+    """Статистика пула соединений."""
+    return jsonify({"pool": DB.stats()}), 200
+
+
 if __name__ == "__main__":
     app.run(debug=True, host="127.0.0.1", port=5000)
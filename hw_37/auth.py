@@ -4,7 +4,7 @@
 
 import json
 from typing import Dict, List
-from flask import Response
+from flask import Response, request
 from functools import wraps
 
 
@@ -1,3 +1,5 @@
+import base64
+import json
 from datetime import datetime
 from flask import Blueprint, request, jsonify
 from auth import (
@@ -8,6 +10,18 @@ from auth import (
     require_admin,
 )
 from models import Appointment, Master
+from blueprints.streaming import get_stream_format, stream_items
+from blueprints.bulk import (
+    get_bulk_items,
+    get_bulk_ids,
+    parse_id,
+    existing_values,
+    select_by_ids,
+    insert_rows,
+    update_rows,
+    delete_ids,
+    bulk_response,
+)
 
 
 # Создание блюпринта с префиксом /appointments
@@ -30,42 +44,146 @@ def appointment_to_dict(appointment):
     }
 
 
-def validate_appointment_data(data):
+# Пагинация списка записей
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+APPOINTMENT_FIELDS = ["id", "client_name", "client_phone", "date", "master", "status"]
+
+
+def encode_cursor(sort_value, appointment_id):
+    """Кодирует позицию последней записи страницы в непрозрачный курсор."""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_value, appointment_id], ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor, sort_by):
     """
-    Валидация данных записи.
+    Раскодирует курсор.
+    Возвращает (значение поля сортировки, id) или вызывает ValueError.
+    """
+    try:
+        sort_value, appointment_id = json.loads(
+            base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        )
+        appointment_id = int(appointment_id)
+        if sort_by == "date":
+            sort_value = datetime.fromisoformat(sort_value)
+    except (ValueError, TypeError, UnicodeError):
+        raise ValueError("Некорректный cursor")
+    return sort_value, appointment_id
+
+
+def appointment_row_to_dict(row, fields):
+    """Преобразует строку выборки (.dicts()) в словарь только с нужными полями."""
+    result = {}
+    for field in fields:
+        if field == "master":
+            result["master"] = {
+                "id": row["master_id"],
+                "first_name": row["master_first_name"],
+                "last_name": row["master_last_name"],
+            }
+        elif field == "date":
+            result["date"] = row["date"].strftime("%Y-%m-%d %H:%M:%S")
+        else:
+            result[field] = row[field]
+    return result
+
+
+def validate_appointment_fields(data):
+    """
+    Валидация полей записи без обращения к БД.
     Возвращает (True, "") при успехе или (False, "сообщение об ошибке")
     """
     if not isinstance(data, dict):
         return False, "Данные должны быть JSON-объектом"
 
-    required_fields = ["client_name", "client_phone", "master_id"]
+    required_fields = ["client_name", "client_phone"]
     for field in required_fields:
         value = data.get(field)
         if not value or not isinstance(value, str) or not value.strip():
             return False, f"Поле '{field}' обязательно и не может быть пустым"
 
+    # master_id — число или строка из цифр
+    if data.get("master_id") in (None, ""):
+        return False, "Поле 'master_id' обязательно и не может быть пустым"
     try:
-        master_id = int(data["master_id"])
-        if master_id <= 0:
-            return False, "master_id должен быть положительным числом"
-        if not Master.select().where(Master.id == master_id).exists():
-            return False, "Мастер с таким ID не найден"
-    except (ValueError, TypeError):
-        return False, "master_id должен быть целым числом"
+        parse_id(data["master_id"])
+    except ValueError:
+        return False, "master_id должен быть положительным целым числом"
 
-    status = data.get("status", "pending").strip()
+    status = data.get("status", "pending")
     allowed_statuses = ["pending", "confirmed", "completed", "cancelled"]
-    if status not in allowed_statuses:
+    if not isinstance(status, str) or status.strip() not in allowed_statuses:
         return False, f"status может быть одним из: {', '.join(allowed_statuses)}"
 
     return True, ""
 
 
+def validate_appointment_changes(data):
+    """
+    Валидация частичного обновления записи (как в PUT /appointments/<id>).
+    Возвращает (изменения, "") при успехе или (None, "сообщение об ошибке");
+    master_id в изменениях уже приведён к int.
+    """
+    if not isinstance(data, dict):
+        return None, "Данные должны быть JSON-объектом"
+
+    changes = {}
+    if "master_id" in data:
+        try:
+            changes["master_id"] = parse_id(data["master_id"])
+        except ValueError:
+            return None, "master_id должен быть положительным числом"
+
+    for field in ["client_name", "client_phone"]:
+        if field in data:
+            value = data[field]
+            if not isinstance(value, str) or not value.strip():
+                return None, f"{field} не может быть пустым"
+            changes[field] = value.strip()
+
+    if "status" in data:
+        status = data["status"]
+        allowed = ["pending", "confirmed", "completed", "cancelled"]
+        if not isinstance(status, str) or status.strip() not in allowed:
+            return None, f"status: допустимы {', '.join(allowed)}"
+        changes["status"] = status.strip()
+
+    return changes, ""
+
+
+def validate_appointment_data(data):
+    """
+    Валидация данных записи (с проверкой существования мастера).
+    Возвращает (True, "") при успехе или (False, "сообщение об ошибке")
+    """
+    is_valid, msg = validate_appointment_fields(data)
+    if not is_valid:
+        return is_valid, msg
+    if not Master.select().where(Master.id == parse_id(data["master_id"])).exists():
+        return False, "Мастер с таким ID не найден"
+    return True, ""
+
+
 @appointments_bp.route("/", methods=["GET"])
 @require_api_key
 def get_appointments():
-    """Получить все записи с возможной сортировкой."""
+    """
+    Получить записи постранично с возможной сортировкой.
+    Параметры: sort_by, direction, limit (не более MAX_PAGE_SIZE),
+    cursor (из next_cursor предыдущей страницы), fields (через запятую).
+    С параметром stream=json|ndjson отдаются все записи после cursor
+    потоком, без limit и next_cursor.
+    """
     try:
+        try:
+            stream_format = get_stream_format()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
         sort_by = request.args.get("sort_by", "id")
         direction = request.args.get("direction", "asc").lower()
 
@@ -75,20 +193,86 @@ def get_appointments():
             "client_name": Appointment.client_name,
             "status": Appointment.status,
         }
+        if sort_by not in valid_sort_fields:
+            sort_by = "id"
+        descending = direction == "desc"
+        sort_field = valid_sort_fields[sort_by]
 
-        query = Appointment.select().join(Master)
-
-        if sort_by in valid_sort_fields:
-            field = valid_sort_fields[sort_by]
-            if direction == "desc":
-                query = query.order_by(field.desc())
-            else:
-                query = query.order_by(field.asc())
+        try:
+            limit = int(request.args.get("limit", DEFAULT_PAGE_SIZE))
+        except ValueError:
+            return jsonify({"error": "limit должен быть целым числом"}), 400
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+        fields_arg = request.args.get("fields")
+        if fields_arg:
+            fields = [f.strip() for f in fields_arg.split(",") if f.strip()]
+            unknown = [f for f in fields if f not in APPOINTMENT_FIELDS]
+            if unknown:
+                return (
+                    jsonify({"error": f"Неизвестные поля: {', '.join(unknown)}"}),
+                    400,
+                )
         else:
-            query = query.order_by(Appointment.id.asc())
+            fields = APPOINTMENT_FIELDS
+
+        # Выбираем только нужные столбцы (+ id и поле сортировки для курсора)
+        columns = [Appointment.id]
+        for name in ["client_name", "client_phone", "date", "status"]:
+            if name in fields or name == sort_by:
+                columns.append(getattr(Appointment, name))
+        query = Appointment.select(*columns)
+        if "master" in fields:
+            query = query.join(Master).select_extend(
+                Master.id.alias("master_id"),
+                Master.first_name.alias("master_first_name"),
+                Master.last_name.alias("master_last_name"),
+            )
+
+        # Keyset-пагинация: продолжаем строго после последней записи страницы
+        cursor = request.args.get("cursor")
+        if cursor:
+            try:
+                last_value, last_id = decode_cursor(cursor, sort_by)
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
+            if sort_by == "id":
+                query = query.where(
+                    Appointment.id < last_id if descending else Appointment.id > last_id
+                )
+            elif descending:
+                query = query.where(
+                    (sort_field < last_value)
+                    | ((sort_field == last_value) & (Appointment.id < last_id))
+                )
+            else:
+                query = query.where(
+                    (sort_field > last_value)
+                    | ((sort_field == last_value) & (Appointment.id > last_id))
+                )
 
-        result = [appointment_to_dict(a) for a in query]
-        return jsonify({"appointments": result}), 200
+        if descending:
+            query = query.order_by(sort_field.desc(), Appointment.id.desc())
+        else:
+            query = query.order_by(sort_field.asc(), Appointment.id.asc())
+
+        if stream_format:
+            rows = query.dicts().iterator()
+            return stream_items(
+                "appointments",
+                (appointment_row_to_dict(row, fields) for row in rows),
+                stream_format,
+            )
+
+        rows = list(query.limit(limit + 1).dicts())
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last[sort_by], last["id"])
+
+        result = [appointment_row_to_dict(row, fields) for row in rows]
+        return jsonify({"appointments": result, "next_cursor": next_cursor}), 200
 
     except Exception as e:
         return (
@@ -102,7 +286,13 @@ def get_appointments():
 def get_appointment(id):
     """Получить запись по ID."""
     try:
-        appointment = Appointment.get(Appointment.id == id)
+        # Мастер выбирается тем же запросом, без отдельного SELECT
+        appointment = (
+            Appointment.select(Appointment, Master)
+            .join(Master)
+            .where(Appointment.id == id)
+            .get()
+        )
         return jsonify({"appointment": appointment_to_dict(appointment)}), 200
     except Appointment.DoesNotExist:
         return jsonify({"error": "Запись не найдена"}), 404
@@ -118,7 +308,12 @@ def get_appointments_by_master(master_id):
         if not Master.select().where(Master.id == master_id).exists():
             return jsonify({"error": "Мастер не найден"}), 404
 
-        appointments = Appointment.select().where(Appointment.master == master_id)
+        # JOIN вместо отдельного запроса мастера для каждой записи
+        appointments = (
+            Appointment.select(Appointment, Master)
+            .join(Master)
+            .where(Appointment.master == master_id)
+        )
         result = [appointment_to_dict(a) for a in appointments]
         return jsonify({"appointments": result}), 200
 
@@ -143,7 +338,7 @@ def create_appointment():
         if not is_valid:
             return jsonify({"error": msg}), 400
 
-        master_id = int(data["master_id"])
+        master_id = parse_id(data["master_id"])
         try:
             master = Master.get(Master.id == master_id)
         except Master.DoesNotExist:
@@ -162,13 +357,209 @@ def create_appointment():
         return jsonify({"error": "Ошибка создания", "details": str(e)}), 500
 
 
+@appointments_bp.route("/bulk", methods=["POST"])
+@require_api_key
+@require_admin
+def create_appointments_bulk():
+    """
+    Создать записи пакетом.
+    Все master_id пакета проверяются разом, корректные записи
+    вставляются одной транзакцией.
+    В ответе — результат для каждого объекта (id или error) по порядку.
+    """
+    try:
+        try:
+            items = get_bulk_items()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        results = [None] * len(items)
+        for index, data in enumerate(items):
+            is_valid, msg = validate_appointment_fields(data)
+            if not is_valid:
+                results[index] = {"index": index, "error": msg}
+
+        master_ids = [
+            parse_id(data["master_id"])
+            for index, data in enumerate(items)
+            if results[index] is None
+        ]
+        known_masters = existing_values(Master.id, master_ids)
+
+        rows = []
+        positions = []
+        for index, data in enumerate(items):
+            if results[index] is not None:
+                continue
+            master_id = parse_id(data["master_id"])
+            if master_id not in known_masters:
+                results[index] = {
+                    "index": index,
+                    "error": "Мастер с таким ID не найден",
+                }
+                continue
+            rows.append(
+                {
+                    "client_name": data["client_name"].strip(),
+                    "client_phone": data["client_phone"].strip(),
+                    "master": master_id,
+                    "status": data.get("status", "pending").strip(),
+                }
+            )
+            positions.append(index)
+
+        if rows:
+            for index, appointment_id in zip(positions, insert_rows(Appointment, rows)):
+                results[index] = {"index": index, "id": appointment_id}
+
+        return jsonify(bulk_response(results)), 200
+    except Exception as e:
+        print(f"Ошибка при пакетном создании записей: {e}")
+        return jsonify({"error": "Ошибка создания", "details": str(e)}), 500
+
+
+@appointments_bp.route("/bulk", methods=["PUT"])
+@require_api_key
+@require_admin
+def update_appointments_bulk():
+    """
+    Обновить записи пакетом: объекты {"id": ..., поля как в PUT /<id>}.
+    Записи и новые master_id пакета проверяются разом,
+    изменения сохраняются через bulk_update одной транзакцией.
+    В ответе — результат для каждого объекта (id или error) по порядку.
+    """
+    try:
+        try:
+            items = get_bulk_items()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        results = [None] * len(items)
+        parsed = {}  # позиция → (id, изменения)
+        seen = set()
+        for index, data in enumerate(items):
+            try:
+                appointment_id = parse_id(
+                    data.get("id") if isinstance(data, dict) else None
+                )
+            except ValueError:
+                results[index] = {
+                    "index": index,
+                    "error": "id должен быть положительным целым числом",
+                }
+                continue
+            if appointment_id in seen:
+                results[index] = {"index": index, "error": "id повторяется в пакете"}
+                continue
+            seen.add(appointment_id)
+            changes, msg = validate_appointment_changes(data)
+            if changes is None:
+                results[index] = {"index": index, "error": msg}
+                continue
+            parsed[index] = (appointment_id, changes)
+
+        appointments = select_by_ids(
+            Appointment.select(),
+            Appointment.id,
+            [appointment_id for appointment_id, _ in parsed.values()],
+        )
+        known_masters = existing_values(
+            Master.id,
+            [c["master_id"] for _, c in parsed.values() if "master_id" in c],
+        )
+
+        changed = []
+        for index, (appointment_id, changes) in parsed.items():
+            appointment = appointments.get(appointment_id)
+            if appointment is None:
+                results[index] = {"index": index, "error": "Запись не найдена"}
+                continue
+            if "master_id" in changes and changes["master_id"] not in known_masters:
+                results[index] = {"index": index, "error": "Мастер не найден"}
+                continue
+            for field, value in changes.items():
+                setattr(appointment, field, value)
+            changed.append(appointment)
+            results[index] = {"index": index, "id": appointment_id}
+
+        if changed:
+            update_rows(
+                Appointment,
+                changed,
+                [
+                    Appointment.client_name,
+                    Appointment.client_phone,
+                    Appointment.master,
+                    Appointment.status,
+                ],
+            )
+
+        return jsonify(bulk_response(results, "updated")), 200
+    except Exception as e:
+        print(f"Ошибка при пакетном обновлении записей: {e}")
+        return jsonify({"error": "Ошибка обновления", "details": str(e)}), 500
+
+
+@appointments_bp.route("/bulk", methods=["DELETE"])
+@require_api_key
+@require_admin
+def delete_appointments_bulk():
+    """
+    Удалить записи пакетом: список id (или объектов {"id": ...}).
+    Существование всех записей проверяется разом, удаление — одной транзакцией.
+    В ответе — результат для каждого id (id или error) по порядку.
+    """
+    try:
+        try:
+            ids = get_bulk_ids()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        found = existing_values(Appointment.id, [i for i, _ in ids if i is not None])
+        results = []
+        deleted = []
+        seen = set()
+        for index, (appointment_id, msg) in enumerate(ids):
+            if appointment_id is None:
+                results.append({"index": index, "error": msg})
+            elif appointment_id in seen:
+                results.append(
+                    {
+                        "index": index,
+                        "id": appointment_id,
+                        "error": "id повторяется в пакете",
+                    }
+                )
+            elif appointment_id not in found:
+                results.append(
+                    {"index": index, "id": appointment_id, "error": "Запись не найдена"}
+                )
+            else:
+                seen.add(appointment_id)
+                deleted.append(appointment_id)
+                results.append({"index": index, "id": appointment_id})
+
+        if deleted:
+            delete_ids(Appointment, deleted)
+
+        return jsonify(bulk_response(results, "deleted")), 200
+    except Exception as e:
+        print(f"Ошибка при пакетном удалении записей: {e}")
+        return jsonify({"error": "Ошибка удаления", "details": str(e)}), 500
+
+
 @appointments_bp.route("/<int:id>", methods=["PUT"])
 @require_api_key
 @require_admin
 def update_appointment(id):
     """Обновить запись."""
     try:
-        appointment = Appointment.get(Appointment.id == id)
+        appointment = (
+            Appointment.select(Appointment, Master)
+            .join(Master)
+            .where(Appointment.id == id)
+            .get()
+        )
         data = request.json
         if not data or not isinstance(data, dict):
             return jsonify({"error": "Ожидается JSON"}), 400
@@ -180,9 +571,11 @@ def update_appointment(id):
                     jsonify({"error": "master_id должен быть положительным числом"}),
                     400,
                 )
-            if not Master.select().where(Master.id == master_id).exists():
+            try:
+                # объект мастера сразу пригодится для ответа (без ленивой загрузки)
+                appointment.master = Master.get(Master.id == master_id)
+            except Master.DoesNotExist:
                 return jsonify({"error": "Мастер не найден"}), 400
-            appointment.master = master_id
 
         if "client_name" in data:
             name = data["client_name"].strip()
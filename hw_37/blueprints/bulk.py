@@ -0,0 +1,136 @@
+"""
+Общие помощники для пакетных (bulk) операций.
+"""
+
+from flask import request
+from peewee import chunked
+from models import DB
+
+
+# Максимум объектов в одном пакетном запросе
+MAX_BULK_ITEMS = 50_000
+# Строк в одном INSERT/UPDATE и значений в одном IN (...) — с запасом до лимита
+# SQLite на число параметров запроса
+INSERT_BATCH_SIZE = 100
+LOOKUP_BATCH_SIZE = 500
+
+
+def get_bulk_items():
+    """
+    Достаёт список объектов из тела запроса: JSON-массив
+    или объект вида {"items": [...]}.
+    Вызывает ValueError, если тело не подходит.
+    """
+    data = request.get_json(silent=True)
+    if isinstance(data, dict):
+        data = data.get("items")
+    if not isinstance(data, list) or not data:
+        raise ValueError("Ожидается непустой JSON-массив объектов")
+    if len(data) > MAX_BULK_ITEMS:
+        raise ValueError(f"Не более {MAX_BULK_ITEMS} объектов за один запрос")
+    return data
+
+
+def parse_id(value):
+    """
+    Приводит идентификатор из JSON (число или строка из цифр) к int.
+    Вызывает ValueError, если это не положительное целое.
+    """
+    if isinstance(value, bool):
+        raise ValueError
+    if isinstance(value, str):
+        value = value.strip()
+        if not value.isdigit():
+            raise ValueError
+    elif not isinstance(value, int):
+        raise ValueError
+    value = int(value)
+    if value <= 0:
+        raise ValueError
+    return value
+
+
+def get_bulk_ids():
+    """
+    Достаёт из тела запроса список id для пакетного удаления
+    (числа или объекты {"id": ...}).
+    :return: пары (id или None, сообщение об ошибке или "")
+    """
+    parsed = []
+    for item in get_bulk_items():
+        value = item.get("id") if isinstance(item, dict) else item
+        try:
+            parsed.append((parse_id(value), ""))
+        except ValueError:
+            parsed.append((None, "id должен быть положительным целым числом"))
+    return parsed
+
+
+def existing_values(field, values):
+    """
+    Возвращает множество значений из values, которые уже есть в столбце field.
+    Выполняет один SELECT на каждые LOOKUP_BATCH_SIZE значений.
+    """
+    found = set()
+    for batch in chunked(list(set(values)), LOOKUP_BATCH_SIZE):
+        query = field.model.select(field).where(field.in_(batch)).tuples()
+        found.update(value for (value,) in query)
+    return found
+
+
+def insert_rows(model, rows):
+    """
+    Вставляет строки через insert_many в одной транзакции.
+    Возвращает id вставленных строк в порядке rows.
+    """
+    ids = []
+    with DB.atomic():
+        for batch in chunked(rows, INSERT_BATCH_SIZE):
+            last_id = model.insert_many(batch).execute()
+            # Внутри транзакции писатель один, и SQLite выдаёт rowid
+            # одного многострочного INSERT подряд — восстанавливаем их по последнему
+            ids.extend(range(last_id - len(batch) + 1, last_id + 1))
+    return ids
+
+
+def select_by_ids(query, field, ids):
+    """
+    Выполняет query для всех ids (по LOOKUP_BATCH_SIZE в одном IN).
+    :return: словарь id → объект
+    """
+    found = {}
+    for batch in chunked(list(set(ids)), LOOKUP_BATCH_SIZE):
+        for obj in query.where(field.in_(batch)):
+            found[obj.id] = obj
+    return found
+
+
+def update_rows(model, instances, fields):
+    """Сохраняет изменённые объекты через bulk_update в одной транзакции."""
+    with DB.atomic():
+        model.bulk_update(instances, fields=fields, batch_size=INSERT_BATCH_SIZE)
+
+
+def delete_ids(model, ids, *dependents):
+    """
+    Удаляет строки по id в одной транзакции.
+    :param dependents: внешние ключи на model, строки по которым удаляются первыми
+    """
+    with DB.atomic():
+        for batch in chunked(ids, LOOKUP_BATCH_SIZE):
+            for foreign_key in dependents:
+                foreign_key.model.delete().where(foreign_key.in_(batch)).execute()
+            model.delete().where(model.id.in_(batch)).execute()
+
+
+def bulk_response(results, action="created"):
+    """
+    Сводка по пакету: результат для каждого объекта и счётчики.
+    :param action: имя счётчика успешных операций (created, updated, deleted)
+    """
+    succeeded = sum(1 for item in results if "error" not in item)
+    return {
+        "results": results,
+        action: succeeded,
+        "failed": len(results) - succeeded,
+    }
@@ -8,6 +8,18 @@ from auth import (
     require_admin,
 )
 from models import Master
+from blueprints.streaming import get_stream_format, stream_items
+from blueprints.bulk import (
+    get_bulk_items,
+    get_bulk_ids,
+    parse_id,
+    existing_values,
+    select_by_ids,
+    insert_rows,
+    update_rows,
+    delete_ids,
+    bulk_response,
+)
 
 
 # Создание блюпринта с префиксом /masters
@@ -83,8 +95,19 @@ def require_admin(f):
 @masters_bp.route("/", methods=["GET"])
 @require_api_key
 def get_masters():
-    """Получить список всех мастеров."""
+    """
+    Получить список всех мастеров.
+    С параметром stream=json|ndjson список отдаётся потоково.
+    """
     try:
+        try:
+            stream_format = get_stream_format()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        if stream_format:
+            rows = Master.select().order_by(Master.id).dicts().iterator()
+            return stream_items("masters", rows, stream_format)
+
         masters = Master.select()
         result = [master_to_dict(m) for m in masters]
         return jsonify({"masters": result}), 200
@@ -138,6 +161,202 @@ def create_master():
         return jsonify({"error": "Ошибка создания", "details": str(e)}), 500
 
 
+@masters_bp.route("/bulk", methods=["POST"])
+@require_api_key
+@require_admin
+def create_masters_bulk():
+    """
+    Создать мастеров пакетом.
+    Телефоны всего пакета проверяются на уникальность разом,
+    корректные мастера вставляются одной транзакцией.
+    В ответе — результат для каждого объекта (id или error) по порядку.
+    """
+    try:
+        try:
+            items = get_bulk_items()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        results = [None] * len(items)
+        for index, data in enumerate(items):
+            is_valid, msg = validate_master_data(data)
+            if not is_valid:
+                results[index] = {"index": index, "error": msg}
+
+        phones = [
+            data["phone"].strip()
+            for index, data in enumerate(items)
+            if results[index] is None
+        ]
+        taken = existing_values(Master.phone, phones)
+
+        rows = []
+        positions = []
+        for index, data in enumerate(items):
+            if results[index] is not None:
+                continue
+            phone = data["phone"].strip()
+            if phone in taken:
+                results[index] = {
+                    "index": index,
+                    "error": "Телефон уже используется другим мастером",
+                }
+                continue
+            taken.add(phone)  # повтор внутри пакета тоже считается занятым
+            rows.append(
+                {
+                    "first_name": data["first_name"].strip(),
+                    "last_name": data["last_name"].strip(),
+                    "middle_name": data.get("middle_name"),
+                    "phone": phone,
+                }
+            )
+            positions.append(index)
+
+        if rows:
+            for index, master_id in zip(positions, insert_rows(Master, rows)):
+                results[index] = {"index": index, "id": master_id}
+
+        return jsonify(bulk_response(results)), 200
+    except Exception as e:
+        print(f"Ошибка при пакетном создании мастеров: {e}")
+        return jsonify({"error": "Ошибка создания", "details": str(e)}), 500
+
+
+@masters_bp.route("/bulk", methods=["PUT"])
+@require_api_key
+@require_admin
+def update_masters_bulk():
+    """
+    Обновить мастеров пакетом: объекты {"id": ..., поля как в PUT /<id>}.
+    Мастера и занятость телефонов проверяются разом,
+    изменения сохраняются через bulk_update одной транзакцией.
+    В ответе — результат для каждого объекта (id или error) по порядку.
+    """
+    try:
+        try:
+            items = get_bulk_items()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        results = [None] * len(items)
+        parsed = {}  # позиция → id мастера
+        seen = set()
+        for index, data in enumerate(items):
+            try:
+                master_id = parse_id(data.get("id") if isinstance(data, dict) else None)
+            except ValueError:
+                results[index] = {
+                    "index": index,
+                    "error": "id должен быть положительным целым числом",
+                }
+                continue
+            if master_id in seen:
+                results[index] = {"index": index, "error": "id повторяется в пакете"}
+                continue
+            seen.add(master_id)
+            is_valid, msg = validate_master_data(data)
+            if not is_valid:
+                results[index] = {"index": index, "error": msg}
+                continue
+            parsed[index] = master_id
+
+        masters = select_by_ids(Master.select(), Master.id, parsed.values())
+        # владельцы телефонов пакета: телефон → id мастера
+        owners = {
+            master.phone: master.id
+            for master in select_by_ids(
+                Master.select(Master.id, Master.phone),
+                Master.phone,
+                [items[index]["phone"].strip() for index in parsed],
+            ).values()
+        }
+
+        changed = []
+        for index, master_id in parsed.items():
+            master = masters.get(master_id)
+            if master is None:
+                results[index] = {"index": index, "error": "Мастер не найден"}
+                continue
+            data = items[index]
+            phone = data["phone"].strip()
+            if owners.get(phone, master_id) != master_id:
+                results[index] = {
+                    "index": index,
+                    "error": "Телефон уже используется другим мастером",
+                }
+                continue
+            owners[phone] = master_id  # повтор внутри пакета тоже считается занятым
+            master.first_name = data["first_name"].strip()
+            master.last_name = data["last_name"].strip()
+            master.middle_name = data.get("middle_name")
+            master.phone = phone
+            changed.append(master)
+            results[index] = {"index": index, "id": master_id}
+
+        if changed:
+            update_rows(
+                Master,
+                changed,
+                [Master.first_name, Master.last_name, Master.middle_name, Master.phone],
+            )
+
+        return jsonify(bulk_response(results, "updated")), 200
+    except Exception as e:
+        print(f"Ошибка при пакетном обновлении мастеров: {e}")
+        return jsonify({"error": "Ошибка обновления", "details": str(e)}), 500
+
+
+@masters_bp.route("/bulk", methods=["DELETE"])
+@require_api_key
+@require_admin
+def delete_masters_bulk():
+    """
+    Удалить мастеров и все их записи пакетом: список id (или объектов {"id": ...}).
+    Существование всех мастеров проверяется разом, удаление — одной транзакцией.
+    В ответе — результат для каждого id (id или error) по порядку.
+    """
+    try:
+        try:
+            ids = get_bulk_ids()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        found = existing_values(Master.id, [i for i, _ in ids if i is not None])
+        results = []
+        deleted = []
+        seen = set()
+        for index, (master_id, msg) in enumerate(ids):
+            if master_id is None:
+                results.append({"index": index, "error": msg})
+            elif master_id in seen:
+                results.append(
+                    {
+                        "index": index,
+                        "id": master_id,
+                        "error": "id повторяется в пакете",
+                    }
+                )
+            elif master_id not in found:
+                results.append(
+                    {"index": index, "id": master_id, "error": "Мастер не найден"}
+                )
+            else:
+                seen.add(master_id)
+                deleted.append(master_id)
+                results.append({"index": index, "id": master_id})
+
+        if deleted:
+            from models import Appointment
+
+            delete_ids(Master, deleted, Appointment.master)
+
+        return jsonify(bulk_response(results, "deleted")), 200
+    except Exception as e:
+        print(f"Ошибка при пакетном удалении мастеров: {e}")
+        return jsonify({"error": "Ошибка удаления", "details": str(e)}), 500
+
+
 @masters_bp.route("/<int:id>", methods=["PUT"])
 @require_api_key
 @require_admin
@@ -0,0 +1,80 @@
+"""
+Потоковая отдача больших списков в формате JSON или NDJSON.
+"""
+
+import json
+from itertools import chain
+from flask import Response, request, stream_with_context
+
+
+# Сколько объектов склеивается в один кусок ответа
+STREAM_BATCH_SIZE = 500
+STREAM_FORMATS = ("json", "ndjson")
+
+
+def get_stream_format():
+    """
+    Возвращает формат потоковой отдачи из параметра stream
+    ("json" или "ndjson"), None — обычный ответ.
+    Вызывает ValueError при неизвестном формате.
+    """
+    fmt = request.args.get("stream")
+    if not fmt:
+        return None
+    fmt = fmt.lower()
+    if fmt not in STREAM_FORMATS:
+        raise ValueError(f"stream может быть одним из: {', '.join(STREAM_FORMATS)}")
+    return fmt
+
+
+def _dumps(item):
+    return json.dumps(item, ensure_ascii=False, separators=(",", ":"))
+
+
+def _json_chunks(key, items):
+    """Отдаёт {"key": [...]} по частям, не собирая список целиком."""
+    yield f'{{"{key}":['
+    batch = []
+    first = True
+    for item in items:
+        batch.append(_dumps(item))
+        if len(batch) >= STREAM_BATCH_SIZE:
+            yield ("" if first else ",") + ",".join(batch)
+            first = False
+            batch = []
+    if batch:
+        yield ("" if first else ",") + ",".join(batch)
+    yield "]}"
+
+
+def _ndjson_chunks(items):
+    """Отдаёт по одному JSON-объекту на строку."""
+    batch = []
+    for item in items:
+        batch.append(_dumps(item) + "\n")
+        if len(batch) >= STREAM_BATCH_SIZE:
+            yield "".join(batch)
+            batch = []
+    if batch:
+        yield "".join(batch)
+
+
+def stream_items(key, items, fmt):
+    """
+    Потоковый ответ со списком объектов.
+    items — итератор словарей (например, query.dicts().iterator()),
+    он выполняется внутри контекста запроса, поэтому соединение с БД
+    возвращается в пул только после отправки последнего куска.
+    Первый объект читается сразу: SQL-запрос выполняется до возврата ответа,
+    так что его ошибки (в том числе превышение бюджета) приходят обычным
+    JSON-ответом, а X-Query-Count учитывает этот запрос.
+    """
+    items = iter(items)
+    first = next(items, None)
+    if first is not None:
+        items = chain((first,), items)
+    if fmt == "ndjson":
+        chunks, mimetype = _ndjson_chunks(items), "application/x-ndjson"
+    else:
+        chunks, mimetype = _json_chunks(key, items), "application/json"
+    return Response(stream_with_context(chunks), mimetype=mimetype)
@@ -3,17 +3,110 @@ ORM-модели для барбершопа: Master и Appointment
 Созданы на основе PeeWee ORM. Поле id добавляется автоматически.
 """
 
+import threading
 from datetime import datetime
+from typing import Optional
 from peewee import (
     Model,
-    SqliteDatabase,
     CharField,
     DateTimeField,
     ForeignKeyField,
 )
+from playhouse.pool import MaxConnectionsExceeded, PooledSqliteDatabase
 
-# Подключение к SQLite-базе
-DB = SqliteDatabase("barbershop.db")
+
+class QueryBudgetExceeded(Exception):
+    """Запрос превысил отладочный бюджет SQL-запросов."""
+
+
+class StatsPooledSqliteDatabase(PooledSqliteDatabase):
+    """
+    Пул SQLite-соединений со счётчиками.
+    Соединение выдаётся потоку на время запроса и возвращается в пул,
+    а не закрывается; pragmas применяются один раз при открытии соединения.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._local = threading.local()  # счётчик запросов текущего потока
+        self.checkouts = 0
+        self.waits = 0
+
+    def execute_sql(self, sql, *args, **kwargs):
+        count = getattr(self._local, "queries", 0) + 1
+        self._local.queries = count
+        budget = getattr(self._local, "budget", None)
+        if budget is not None and count > budget:
+            # Ошибка до выполнения: запрос сверх бюджета ничего не запишет,
+            # а открытая транзакция (DB.atomic) откатится
+            raise QueryBudgetExceeded(
+                f"Превышен бюджет SQL-запросов: {count} > {budget}"
+            )
+        return super().execute_sql(sql, *args, **kwargs)
+
+    def reset_query_count(self, budget: Optional[int] = None) -> None:
+        """
+        Обнуляет счётчик SQL-запросов текущего потока.
+        :param budget: сколько запросов разрешено до сброса (None — без ограничения)
+        """
+        self._local.queries = 0
+        self._local.budget = budget
+
+    def query_count(self) -> int:
+        """Число SQL-запросов текущего потока с последнего сброса."""
+        return getattr(self._local, "queries", 0)
+
+    def connect(self, reuse_if_open=False):
+        # PooledDatabase.connect повторяет _connect, пока ждёт свободное соединение,
+        # поэтому ожидание засчитывается один раз на вызов connect()
+        self._local.waited = False
+        try:
+            opened = super().connect(reuse_if_open)
+        finally:
+            if self._local.waited:
+                with self._stats_lock:
+                    self.waits += 1
+        if opened:
+            with self._stats_lock:
+                self.checkouts += 1
+        return opened
+
+    def _connect(self):
+        try:
+            return super()._connect()
+        except MaxConnectionsExceeded:
+            # все соединения заняты — connect() подождёт и попробует снова
+            self._local.waited = True
+            raise
+
+    def stats(self) -> dict:
+        """
+        Статистика пула.
+        :return: checkouts, waits, in_use, idle и open (всего открытых соединений)
+        """
+        with self._pool_lock:
+            in_use = len(self._in_use)
+            idle = len(self._connections)
+        with self._stats_lock:
+            checkouts, waits = self.checkouts, self.waits
+        return {
+            "checkouts": checkouts,
+            "waits": waits,
+            "in_use": in_use,
+            "idle": idle,
+            "open": in_use + idle,
+        }
+
+
+# Пул подключений к SQLite-базе: WAL позволяет читать параллельно с записью
+DB = StatsPooledSqliteDatabase(
+    "barbershop.db",
+    max_connections=16,
+    stale_timeout=300,
+    timeout=10,
+    pragmas={"journal_mode": "wal", "synchronous": "normal"},
+)
 
 
 class Master(Model):
@@ -1,6 +1,48 @@
 from abc import ABC, abstractmethod
+from array import array
+from itertools import islice
+from typing import Iterable, Iterator, Optional, Union
+import io
 import json
 import csv
+import mmap
+import os
+import struct
+
+try:
+    import numpy as np
+except ImportError:  # NumPy не обязателен: без него столбцы собираются в array.array
+    np = None
+
+
+# Типы столбцов для типизированного чтения CSV
+COLUMN_TYPECODES = {'int': 'q', 'float': 'd'}
+
+# Политики fsync для сессий дозаписи
+FSYNC_NEVER = 'never'        # полагаться на ОС
+FSYNC_ON_FLUSH = 'on_flush'  # fsync при каждом flush()
+FSYNC_ON_CLOSE = 'on_close'  # fsync один раз при закрытии сессии
+
+# Служебные ключи снимка JsonLinesFile: поколение и сами данные
+_GENERATION_KEY = '__generation__'
+_DATA_KEY = '__data__'
+
+# Символы, которыми может продолжаться число (1.|5, 2|e3, 1e|-3)
+_NUMBER_CHARS = frozenset('0123456789.eE+-')
+
+
+def _fsync_dir(path: str):
+    """
+    fsync каталога, чтобы переименование файла пережило сбой питания.
+    На Windows каталог открыть нельзя — там os.replace уже надёжен.
+    """
+    if os.name == 'nt':
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
 
 class AbstractFile(ABC):
@@ -24,6 +66,193 @@ class AbstractFile(ABC):
         """Добавление данных в файл."""
         pass
 
+    def iter_records(self) -> Iterator:
+        """
+        Ленивое чтение данных по одной записи.
+        По умолчанию опирается на read(); наследники переопределяют
+        метод потоковым чтением с постоянным расходом памяти.
+        """
+        data = self.read()
+        yield from data.items() if isinstance(data, dict) else data
+
+
+class _JsonStream:
+    """
+    Инкрементальный разбор JSON-файла с контейнером верхнего уровня.
+    Читает файл кусками и отдаёт элементы массива или пары объекта по одной.
+    """
+
+    def __init__(self, file, chunk_size: int = 64 * 1024):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Следующий значимый символ (пробелы пропускаются)."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos].isspace():
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise json.JSONDecodeError('Неожиданный конец файла',
+                                           self._buffer, self._pos)
+
+    def _expect(self, char: str):
+        if self._peek() != char:
+            raise json.JSONDecodeError(f"Ожидается '{char}'", self._buffer, self._pos)
+        self._pos += 1
+
+    def _is_number_prefix(self, value, end: int) -> bool:
+        """Может ли число value продолжиться за концом буфера."""
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            return False
+        return all(char in _NUMBER_CHARS for char in self._buffer[end:])
+
+    def _value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue  # значение обрезано границей куска
+                raise
+            # число на границе куска могло быть прочитано не целиком:
+            # raw_decode вернёт префикс (1 из "1.", 2 из "2e")
+            if (not self._eof and self._is_number_prefix(value, end)
+                    and self._fill()):
+                continue
+            self._pos = end
+            return value
+
+    def items(self) -> Iterator:
+        """
+        Элементы массива или пары (ключ, значение) объекта верхнего уровня.
+        Скаляр верхнего уровня отдаётся как единственный элемент.
+        """
+        opening = self._peek()
+        if opening not in '[{':
+            yield self._value()
+            return
+
+        closing = ']' if opening == '[' else '}'
+        self._pos += 1
+        if self._peek() == closing:
+            self._pos += 1
+            return
+        while True:
+            if opening == '{':
+                key = self._value()
+                if not isinstance(key, str):
+                    raise json.JSONDecodeError('Ключ должен быть строкой',
+                                               self._buffer, self._pos)
+                self._expect(':')
+                yield key, self._value()
+            else:
+                yield self._value()
+            if self._peek() == ',':
+                self._pos += 1
+                continue
+            self._expect(closing)
+            return
+
+
+class AppendSession(ABC):
+    """
+    Сессия дозаписи в файл: файл открывается один раз,
+    данные копятся в буфере заданного размера.
+    Используется как контекстный менеджер.
+    """
+
+    def __init__(self, file_path: str, buffer_size: int = 64 * 1024,
+                 fsync: str = FSYNC_NEVER, newline=None):
+        if fsync not in (FSYNC_NEVER, FSYNC_ON_FLUSH, FSYNC_ON_CLOSE):
+            raise ValueError(f"Неизвестная политика fsync: {fsync}")
+        self.fsync = fsync
+        self._file = open(file_path, 'a', encoding='utf-8',
+                          buffering=buffer_size, newline=newline)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @abstractmethod
+    def append(self, data):
+        """Добавление одной записи в буфер."""
+        pass
+
+    def append_many(self, items: Iterable):
+        """Добавление набора записей в буфер."""
+        for item in items:
+            self.append(item)
+
+    def flush(self):
+        """Сброс буфера в файл (и fsync при политике 'on_flush')."""
+        self._file.flush()
+        if self.fsync == FSYNC_ON_FLUSH:
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        """Сброс буфера и закрытие файла."""
+        if self._file.closed:
+            return
+        self._file.flush()
+        if self.fsync != FSYNC_NEVER:
+            os.fsync(self._file.fileno())
+        self._file.close()
+
+
+class TxtAppendSession(AppendSession):
+    """
+    Сессия дозаписи строк в текстовый файл.
+    """
+
+    def __init__(self, file_path: str, buffer_size: int = 64 * 1024,
+                 fsync: str = FSYNC_NEVER):
+        super().__init__(file_path, buffer_size, fsync)
+
+    def append(self, data: str):
+        """Добавление строки."""
+        self._file.write(data + '\n')
+
+    def append_many(self, items: Iterable[str]):
+        """Добавление набора строк одним вызовом записи."""
+        self._file.writelines(line + '\n' for line in items)
+
+
+class CsvAppendSession(AppendSession):
+    """
+    Сессия дозаписи строк в CSV-файл (csv.writer создаётся один раз).
+    """
+
+    def __init__(self, file_path: str, buffer_size: int = 64 * 1024,
+                 fsync: str = FSYNC_NEVER):
+        super().__init__(file_path, buffer_size, fsync, newline='')
+        self._writer = csv.writer(self._file)
+
+    def append(self, data: list[str]):
+        """Добавление строки CSV."""
+        self._writer.writerow(data)
+
+    def append_many(self, items: Iterable[list[str]]):
+        """Добавление набора строк CSV."""
+        self._writer.writerows(items)
+
 
 class JsonFile(AbstractFile):
     """
@@ -56,6 +285,189 @@ class JsonFile(AbstractFile):
         existing_data.update(data)
         self.write(existing_data)
 
+    def iter_items(self, chunk_size: int = 64 * 1024) -> Iterator:
+        """
+        Инкрементальное чтение JSON-файла без загрузки целиком.
+        Для массива отдаёт элементы, для объекта — пары (ключ, значение).
+        :param chunk_size: размер читаемого куска в символах
+        """
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as file:
+                yield from _JsonStream(file, chunk_size).items()
+        except FileNotFoundError:
+            print(f"Файл {self.file_path} не найден.")
+
+    def iter_records(self) -> Iterator:
+        """Ленивое чтение данных по одной записи."""
+        return self.iter_items()
+
+
+
+class JsonLinesFile(AbstractFile):
+    """
+    Журнальный (log-structured) JSON-файл с тем же интерфейсом, что и JsonFile.
+    Снимок состояния хранится в file_path, а каждое append дописывает
+    одну строку JSON в журнал file_path + '.log' — за O(1), без перезаписи файла.
+    read() накладывает журнал на снимок, compact() сворачивает журнал
+    в новый снимок (запись во временный файл и атомарное переименование).
+
+    Снимок и журнал помечены номером поколения: снимок хранится как
+    {"__generation__": N, "__data__": {...}}, первая строка журнала —
+    {"__generation__": N}. write() сначала заменяет снимок (N + 1), затем
+    журнал; если процесс упадёт между шагами, журнал старого поколения
+    при чтении игнорируется и не откатывает записанные данные.
+    Снимок и журнал без поколения (старый формат) считаются поколением 0.
+    """
+
+    def __init__(self, file_path: str, compact_every: int = 1000):
+        """
+        :param file_path: путь к файлу снимка
+        :param compact_every: после скольких append выполнять compact() (0 — никогда)
+        """
+        self.file_path = file_path
+        self.log_path = file_path + '.log'
+        self.compact_every = compact_every
+        self._pending = None  # число записей в журнале (считается при первом append)
+
+    @staticmethod
+    def _header_generation(line: str) -> Optional[int]:
+        """Номер поколения, если строка — заголовок журнала, иначе None."""
+        try:
+            header = json.loads(line)
+        except json.JSONDecodeError:
+            return None
+        if isinstance(header, dict) and list(header) == [_GENERATION_KEY]:
+            return header[_GENERATION_KEY]
+        return None
+
+    def _log_generation(self) -> Optional[int]:
+        """Поколение журнала (None — журнала нет или он пуст)."""
+        try:
+            with open(self.log_path, 'r', encoding='utf-8') as file:
+                line = file.readline()
+        except FileNotFoundError:
+            return None
+        if not line.endswith('\n'):
+            return None
+        generation = self._header_generation(line)
+        return 0 if generation is None else generation
+
+    def iter_updates(self) -> Iterator[dict]:
+        """
+        Лениво читает записи журнала по одной (без заголовка поколения).
+        Оборванная последняя строка (сбой во время записи) пропускается.
+        """
+        try:
+            with open(self.log_path, 'r', encoding='utf-8') as file:
+                for number, line in enumerate(file):
+                    if not line.endswith('\n'):
+                        return
+                    if number == 0 and self._header_generation(line) is not None:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        print(f"Пропущена повреждённая запись в {self.log_path}.")
+        except FileNotFoundError:
+            return
+
+    def _read_snapshot(self) -> tuple[int, dict]:
+        """Поколение и данные снимка."""
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as file:
+                snapshot = json.load(file)
+        except FileNotFoundError:
+            return 0, {}
+        except json.JSONDecodeError:
+            print(f"Файл {self.file_path} содержит некорректные данные JSON.")
+            return 0, {}
+        if isinstance(snapshot, dict) and sorted(snapshot) == [_DATA_KEY, _GENERATION_KEY]:
+            return snapshot[_GENERATION_KEY], snapshot[_DATA_KEY]
+        return 0, snapshot
+
+    def read(self) -> dict:
+        """Чтение данных: снимок + записи журнала того же поколения."""
+        generation, data = self._read_snapshot()
+        if self._log_generation() == generation:
+            for update in self.iter_updates():
+                data.update(update)
+        return data
+
+    def iter_records(self) -> Iterator:
+        """
+        Пары (ключ, значение) итогового состояния.
+        Журнал всё равно нужно наложить целиком, поэтому состояние собирается в памяти.
+        """
+        yield from self.read().items()
+
+    def write(self, data: dict):
+        """Запись данных: снимок нового поколения, затем пустой журнал."""
+        generation = self._read_snapshot()[0] + 1
+        self._write_snapshot({_GENERATION_KEY: generation, _DATA_KEY: data})
+        self._reset_log(generation)
+        self._pending = 0
+
+    def append(self, data: dict):
+        """Добавление данных одной строкой в журнал."""
+        if self._pending is None:
+            generation = self._read_snapshot()[0]
+            if self._log_generation() != generation:
+                # журнала нет или он остался от прошлого поколения (сбой в write)
+                self._reset_log(generation)
+                self._pending = 0
+            else:
+                self._truncate_torn_tail()
+                self._pending = sum(1 for _ in self.iter_updates())
+
+        with open(self.log_path, 'a', encoding='utf-8') as file:
+            file.write(json.dumps(data, ensure_ascii=False) + '\n')
+        self._pending += 1
+
+        if self.compact_every and self._pending >= self.compact_every:
+            self.compact()
+
+    def compact(self):
+        """Сворачивание журнала в снимок."""
+        self.write(self.read())
+
+    def _reset_log(self, generation: int):
+        """Атомарно подменяет журнал пустым журналом заданного поколения."""
+        tmp_path = self.log_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            file.write(json.dumps({_GENERATION_KEY: generation}) + '\n')
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.log_path)
+        _fsync_dir(self.log_path)
+
+    def _truncate_torn_tail(self):
+        """Обрезает оборванную последнюю строку журнала, чтобы новые записи не склеились с ней."""
+        try:
+            with open(self.log_path, 'rb+') as file:
+                size = file.seek(0, os.SEEK_END)
+                position = size
+                while position > 0:
+                    step = min(4096, position)
+                    file.seek(position - step)
+                    chunk = file.read(step)
+                    newline = chunk.rfind(b'\n')
+                    if newline != -1:
+                        position = position - step + newline + 1
+                        break
+                    position -= step
+                if position != size:
+                    file.truncate(position)
+        except FileNotFoundError:
+            pass
+
+    def _write_snapshot(self, data: dict):
+        tmp_path = self.file_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, ensure_ascii=False, indent=4)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.file_path)
+        _fsync_dir(self.file_path)
 
 
 class TxtFile(AbstractFile):
@@ -85,14 +497,191 @@ class TxtFile(AbstractFile):
         with open(self.file_path, 'a', encoding='utf-8') as file:
             file.write(data + '\n')
 
+    def append_many(self, data: Iterable[str]):
+        """Добавление набора строк за одно открытие файла."""
+        with self.open_append() as session:
+            session.append_many(data)
+
+    def iter_lines(self, keepends: bool = False) -> Iterator[str]:
+        """
+        Ленивое построчное чтение текстового файла.
+        :param keepends: оставлять ли символ конца строки
+        """
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    yield line if keepends else line.rstrip('\n')
+        except FileNotFoundError:
+            print(f"Файл {self.file_path} не найден.")
+
+    def iter_records(self) -> Iterator[str]:
+        """Ленивое чтение данных по одной строке."""
+        return self.iter_lines()
+
+    def open_append(self, buffer_size: int = 64 * 1024,
+                    fsync: str = FSYNC_NEVER) -> TxtAppendSession:
+        """
+        Открывает буферизованную сессию дозаписи.
+        :param buffer_size: размер буфера в байтах
+        :param fsync: политика fsync ('never', 'on_flush', 'on_close')
+        """
+        return TxtAppendSession(self.file_path, buffer_size, fsync)
+
+
+class CsvRowIndex:
+    """
+    Индекс смещений строк CSV-файла для произвольного доступа.
+    Файл отображается в память (mmap), смещения начала строк хранятся
+    рядом в file_path + '.idx' и переиспользуются между запусками.
+    Индекс перестраивается, если у CSV-файла изменились mtime или размер.
+    """
+
+    _HEADER = struct.Struct('<8sqqq')  # сигнатура, mtime_ns, размер, число строк
+    _MAGIC = b'CSVIDX1\0'
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.index_path = file_path + '.idx'
+        self._stamp = None
+        self._offsets = array('q')
+        self._file = None
+        self._data = None
+        self.refresh()
+
+    def _current_stamp(self) -> tuple:
+        stat = os.stat(self.file_path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def refresh(self):
+        """Проверяет актуальность индекса и при необходимости перестраивает его."""
+        stamp = self._current_stamp()
+        if stamp == self._stamp:
+            return
+        self.close()
+        self._stamp = stamp
+        if not self._load_index():
+            self._build_index()
+        if stamp[1] > 0:
+            self._file = open(self.file_path, 'rb')
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _load_index(self) -> bool:
+        try:
+            with open(self.index_path, 'rb') as file:
+                header = file.read(self._HEADER.size)
+                if len(header) != self._HEADER.size:
+                    return False
+                magic, mtime_ns, size, count = self._HEADER.unpack(header)
+                if magic != self._MAGIC or (mtime_ns, size) != self._stamp:
+                    return False
+                offsets = array('q')
+                offsets.frombytes(file.read())
+        except FileNotFoundError:
+            return False
+        if len(offsets) != count + 1:
+            return False
+        self._offsets = offsets
+        return True
+
+    def _build_index(self):
+        """
+        Один проход по файлу: строка CSV заканчивается переводом строки
+        вне кавычек (поля в кавычках могут содержать переводы строк).
+        """
+        offsets = array('q', [0])
+        size = self._stamp[1]
+        if size > 0:
+            with open(self.file_path, 'rb') as file:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    position = 0
+                    in_quotes = False
+                    while position < size:
+                        newline = data.find(b'\n', position)
+                        end = size if newline == -1 else newline + 1
+                        if data[position:end].count(b'"') % 2:
+                            in_quotes = not in_quotes
+                        if not in_quotes:
+                            offsets.append(end)
+                        position = end
+                    if in_quotes:
+                        offsets.append(size)
+        self._offsets = offsets
+
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'wb') as file:
+            file.write(self._HEADER.pack(self._MAGIC, *self._stamp, len(offsets) - 1))
+            offsets.tofile(file)
+        os.replace(tmp_path, self.index_path)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def _parse(self, start: int, end: int) -> list[list[str]]:
+        text = self._data[start:end].decode('utf-8')
+        return list(csv.reader(io.StringIO(text, newline='')))
+
+    def __getitem__(self, key: Union[int, slice]):
+        """
+        Строка по номеру или список строк по срезу — без перечитывания начала файла.
+        """
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            if start >= stop:
+                return []
+            return self._parse(self._offsets[start], self._offsets[stop])
+
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError('Номер строки вне диапазона')
+        rows = self._parse(self._offsets[key], self._offsets[key + 1])
+        return rows[0] if rows else []
+
+    def close(self):
+        """
+        Закрывает отображение файла.
+        Следующий refresh() заново откроет файл (индекс прочитается из .idx).
+        """
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._stamp = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
 
 class CsvFile(AbstractFile):
     """
     Класс для работы с CSV-файлами.
+    После get_row/get_rows файл остаётся отображённым в память:
+    закройте его через close() или используйте CsvFile как контекстный менеджер.
+    Методы записи сами закрывают отображение (на Windows отображённый
+    файл нельзя обрезать).
     """
 
     def __init__(self, file_path: str):
         self.file_path = file_path
+        self._row_index = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Закрывает отображение файла, открытое индексом строк."""
+        if self._row_index is not None:
+            self._row_index.close()
 
     def read(self) -> list[list[str]]:
         """Чтение данных из CSV-файла."""
@@ -106,12 +695,169 @@ class CsvFile(AbstractFile):
 
     def write(self, data: list[list[str]]):
         """Запись данных в CSV-файл."""
+        self.close()
         with open(self.file_path, 'w', encoding='utf-8', newline='') as file:
             writer = csv.writer(file)
             writer.writerows(data)
 
     def append(self, data: list[str]):
         """Добавление данных в CSV-файл."""
+        self.close()
         with open(self.file_path, 'a', encoding='utf-8', newline='') as file:
             writer = csv.writer(file)
-            writer.writerow(data)
\ No newline at end of file
+            writer.writerow(data)
+
+    def append_many(self, data: Iterable[list[str]]):
+        """Добавление набора строк за одно открытие файла."""
+        with self.open_append() as session:
+            session.append_many(data)
+
+    def iter_rows(self, skip: int = 0, limit: Optional[int] = None,
+                  columns: Optional[list[int]] = None) -> Iterator[list[str]]:
+        """
+        Ленивое чтение строк CSV-файла.
+        :param skip: сколько строк пропустить с начала
+        :param limit: сколько строк вернуть (None — все)
+        :param columns: номера столбцов для выборки (None — все)
+        """
+        try:
+            with open(self.file_path, 'r', encoding='utf-8', newline='') as file:
+                rows = islice(csv.reader(file), skip,
+                              None if limit is None else skip + limit)
+                for row in rows:
+                    if columns is None:
+                        yield row
+                    else:
+                        yield [row[i] if i < len(row) else '' for i in columns]
+        except FileNotFoundError:
+            print(f"Файл {self.file_path} не найден.")
+
+    def iter_records(self) -> Iterator[list[str]]:
+        """Ленивое чтение данных по одной строке CSV."""
+        return self.iter_rows()
+
+    @staticmethod
+    def _infer_type(values: list[str]) -> str:
+        """Тип столбца по образцу значений: 'int', 'float' или 'str'."""
+        column_type = 'int'
+        for value in values:
+            if value == '':
+                continue
+            if column_type == 'int':
+                try:
+                    int(value)
+                    continue
+                except ValueError:
+                    column_type = 'float'
+            try:
+                float(value)
+            except ValueError:
+                return 'str'
+        return column_type
+
+    def read_columns(self, schema: Optional[dict] = None, header: bool = True,
+                     chunk_size: int = 65536, sample_size: int = 1000,
+                     use_numpy: Optional[bool] = None) -> tuple[dict, dict]:
+        """
+        Типизированное чтение CSV по столбцам, кусками по chunk_size строк.
+        Числовые столбцы собираются в array.array ('q' / 'd')
+        или, если доступен NumPy, в массивы numpy, разобранные векторно.
+        Пустые ячейки считаются пропусками: в числовом столбце на их месте 0
+        (или NaN для float), а маска пропусков возвращается отдельно.
+        :param schema: {имя столбца: 'int' | 'float' | 'str'}; None — вывести по образцу
+        :param header: первая строка — заголовок
+        :param chunk_size: сколько строк разбирать за раз
+        :param sample_size: объём образца для вывода схемы
+        :param use_numpy: использовать NumPy (None — если установлен)
+        :return: (столбцы, маски пропусков) — словари по именам столбцов
+        """
+        if use_numpy is None:
+            use_numpy = np is not None
+        if use_numpy and np is None:
+            raise ImportError("Для use_numpy=True требуется пакет numpy")
+
+        rows = self.iter_rows()
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return {}, {}
+        if header:
+            names = chunk.pop(0)
+        else:
+            names = [f'col{i}' for i in range(len(chunk[0]))]
+
+        if schema is None:
+            sample = chunk[:sample_size]
+            schema = {name: self._infer_type([row[i] if i < len(row) else ''
+                                              for row in sample])
+                      for i, name in enumerate(names)}
+
+        positions = [(i, name, schema.get(name, 'str')) for i, name in enumerate(names)]
+        parts = {name: [] for name in names}
+        nulls = {name: bytearray() for name in names}
+
+        while chunk:
+            for i, name, column_type in positions:
+                values = [row[i] if i < len(row) else '' for row in chunk]
+                nulls[name].extend(value == '' for value in values)
+                if column_type == 'str':
+                    parts[name].append(values)
+                    continue
+                fill = '0' if column_type == 'int' else 'nan'
+                values = [value or fill for value in values]
+                if use_numpy:
+                    dtype = np.int64 if column_type == 'int' else np.float64
+                    parts[name].append(np.array(values).astype(dtype))
+                else:
+                    convert = int if column_type == 'int' else float
+                    parts[name].append(array(COLUMN_TYPECODES[column_type],
+                                             map(convert, values)))
+            chunk = list(islice(rows, chunk_size))
+
+        columns = {}
+        for _, name, column_type in positions:
+            if column_type == 'str':
+                columns[name] = [value for part in parts[name] for value in part]
+            elif use_numpy:
+                dtype = np.int64 if column_type == 'int' else np.float64
+                columns[name] = (np.concatenate(parts[name]) if parts[name]
+                                 else np.empty(0, dtype=dtype))
+            else:
+                merged = array(COLUMN_TYPECODES[column_type])
+                for part in parts[name]:
+                    merged.extend(part)
+                columns[name] = merged
+        return columns, nulls
+
+    def row_index(self) -> CsvRowIndex:
+        """
+        Индекс строк для произвольного доступа (создаётся при первом обращении,
+        перестраивается при изменении файла).
+        """
+        if self._row_index is None:
+            self._row_index = CsvRowIndex(self.file_path)
+        else:
+            self._row_index.refresh()
+        return self._row_index
+
+    def get_row(self, number: int) -> list[str]:
+        """
+        Чтение строки по номеру за O(1).
+        :param number: номер строки (с нуля, допускаются отрицательные)
+        """
+        return self.row_index()[number]
+
+    def get_rows(self, start: int, stop: int) -> list[list[str]]:
+        """
+        Чтение диапазона строк [start, stop) без чтения начала файла.
+        """
+        return self.row_index()[start:stop]
+
+    def open_append(self, buffer_size: int = 64 * 1024,
+                    fsync: str = FSYNC_NEVER) -> CsvAppendSession:
+        """
+        Открывает буферизованную сессию дозаписи.
+        :param buffer_size: размер буфера в байтах
+        :param fsync: политика fsync ('never', 'on_flush', 'on_close')
+        """
+        self.close()
+        return CsvAppendSession(self.file_path, buffer_size, fsync)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from file_classes import JsonFile, TxtFile, CsvFile
+from file_classes import JsonFile, JsonLinesFile, TxtFile, CsvFile
 
 
 def test_json_file():
@@ -10,6 +10,16 @@ def test_json_file():
     print("После добавления:", json_file.read())
 
 
+def test_json_lines_file():
+    print("\nТестирование JsonLinesFile:")
+    jsonl_file = JsonLinesFile("test_log.json", compact_every=2)
+    jsonl_file.write({"key1": "value1"})
+    jsonl_file.append({"key2": "value2"})
+    print("После добавления:", jsonl_file.read())
+    jsonl_file.append({"key1": "new_value"})
+    print("После сжатия журнала:", jsonl_file.read())
+
+
 def test_txt_file():
     print("\nТестирование TxtFile:")
     txt_file = TxtFile("test.txt")
@@ -17,6 +27,8 @@ def test_txt_file():
     print("После записи:", txt_file.read())
     txt_file.append("Вторая строка.")
     print("После добавления:", txt_file.read())
+    txt_file.append_many(["Третья строка.", "Четвёртая строка."])
+    print("После пакетного добавления:", txt_file.read())
 
 
 def test_csv_file():
@@ -26,9 +38,14 @@ def test_csv_file():
     print("После записи:", csv_file.read())
     csv_file.append(["Charlie", "35"])
     print("После добавления:", csv_file.read())
+    with csv_file.open_append(buffer_size=1024 * 1024) as session:
+        session.append(["Dave", "40"])
+        session.append_many([["Eve", "28"], ["Frank", "33"]])
+    print("После добавления через сессию:", csv_file.read())
 
 
 if __name__ == "__main__":
     test_json_file()
+    test_json_lines_file()
     test_txt_file()
     test_csv_file()
\ No newline at end of file
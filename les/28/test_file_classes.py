@@ -0,0 +1,29 @@
+# test_file_classes.py
+import json
+from file_classes import JsonFile
+
+
+def test_json_iter_items_chunk_boundaries(tmp_path):
+    # Числа, разрезанные границей куска (1.|5, 2|e3), должны читаться целиком
+    documents = [
+        "  [1.5e3]",
+        "[" + "0," * 40 + " 1.5]",
+        '{"a": -12.25E-2, "b": [2e3, true], "c": 0.5}',
+        "3.25",
+    ]
+    json_file = JsonFile(str(tmp_path / "stream.json"))
+    for text in documents:
+        with open(json_file.file_path, "w", encoding="utf-8") as file:
+            file.write(text)
+        expected = json.loads(text)
+        if isinstance(expected, dict):
+            expected = list(expected.items())
+        elif not isinstance(expected, list):
+            expected = [expected]
+        for chunk_size in range(1, len(text) + 2):
+            assert list(json_file.iter_items(chunk_size)) == expected, chunk_size
+
+    text = "[" + "0," * 32766 + " 1.5]"
+    with open(json_file.file_path, "w", encoding="utf-8") as file:
+        file.write(text)
+    assert list(json_file.iter_items()) == json.loads(text)